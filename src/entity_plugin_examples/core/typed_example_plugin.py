@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 from typing import Any, Dict
 
 from pydantic import BaseModel, Field
 
 from entity.plugins.typed_base import LLMMemoryPlugin, LLMProtocol, MemoryProtocol
 
+# LLM errors worth retrying (timeouts, dropped connections); others fail fast
+_TRANSIENT_ERRORS = (TimeoutError, ConnectionError)
+
+
+@lru_cache(maxsize=1024)
+def _counter_key(user_id: str) -> str:
+    """Return the memory key for a user's response counter (reused per user)."""
+    return f"counter:{user_id}"
+
 
 class TypedExamplePlugin(LLMMemoryPlugin):
     """Example plugin using type-safe dependency injection.
@@ -81,29 +92,37 @@ class TypedExamplePlugin(LLMMemoryPlugin):
     async def _generate_with_retries(self, prompt: str, max_retries: int) -> str:
         """Generate response with retry logic.
 
-        Demonstrates type-safe LLM usage with error handling.
+        Demonstrates type-safe LLM usage with error handling. Only transient
+        errors (``_TRANSIENT_ERRORS``) are retried, after a health check and an
+        exponential backoff; any other error fails on the first attempt.
         """
         for attempt in range(max_retries):
             try:
                 # IDE provides autocomplete for generate method!
-                response = await self.llm.generate(prompt)
+                response = (await self.llm.generate(prompt) or "").strip()
 
-                if response and response.strip():
-                    return response.strip()
-
-            except Exception as e:
+            except _TRANSIENT_ERRORS as e:
                 if attempt == max_retries - 1:
                     # Last attempt failed
                     raise RuntimeError(
                         f"LLM generation failed after {max_retries} attempts"
                     ) from e
 
-                # Log retry attempt (IDE knows this method exists)
-                if self.llm.health_check():
-                    continue
-                else:
+                # Health check only after a transient failure
+                # (IDE knows this method exists)
+                if not self.llm.health_check():
                     raise RuntimeError("LLM health check failed") from e
 
+                # Exponential backoff before the next attempt
+                await asyncio.sleep(2**attempt * 0.1)
+                continue
+
+            except Exception as e:
+                raise RuntimeError("LLM generation failed") from e
+
+            if response:
+                return response
+
         raise RuntimeError("Failed to generate response")
 
     async def _store_response(self, context: Any, response: str) -> None:
@@ -124,10 +143,14 @@ class TypedExamplePlugin(LLMMemoryPlugin):
             "plugin": self.__class__.__name__,
         }
 
-        await self.memory.store(key, response_data)
+        # Store the response and update the counter concurrently
+        await asyncio.gather(
+            self.memory.store(key, response_data),
+            self._increment_counter(_counter_key(user_id)),
+        )
 
-        # Update response counter
-        counter_key = f"counter:{user_id}"
+    async def _increment_counter(self, counter_key: str) -> None:
+        """Increment a response counter in memory."""
         current_count = await self.memory.load(counter_key, 0)
         await self.memory.store(counter_key, current_count + 1)
 
@@ -145,8 +168,7 @@ class TypedExamplePlugin(LLMMemoryPlugin):
         Demonstrates type-safe memory retrieval operations.
         """
         # Type-safe memory access
-        counter_key = f"counter:{user_id}"
-        response_count = await self.memory.load(counter_key, 0)
+        response_count = await self.memory.load(_counter_key(user_id), 0)
 
         return {
             "user_id": user_id,
@@ -1,14 +1,48 @@
-"""Specialized examples for domain-specific use cases."""
+"""Specialized examples for domain-specific use cases.
 
-from .code_reviewer import CodeReviewerExample, StaticAnalysisPlugin, CodeMetricsPlugin, SecurityScanPlugin
-from .research_assistant import ResearchAssistantExample, SourceGathererPlugin, FactCheckerPlugin, SynthesizerPlugin
-from .customer_service import CustomerServiceExample, IntentClassifierPlugin, KnowledgeBasePlugin, ResponseGeneratorPlugin
+Each showcase subpackage is imported on first attribute access, so using one
+showcase doesn't load the others.
+"""
+
+import importlib
 
 __all__ = [
     # Code Reviewer
     "CodeReviewerExample", "StaticAnalysisPlugin", "CodeMetricsPlugin", "SecurityScanPlugin",
-    # Research Assistant  
+    # Research Assistant
     "ResearchAssistantExample", "SourceGathererPlugin", "FactCheckerPlugin", "SynthesizerPlugin",
     # Customer Service
     "CustomerServiceExample", "IntentClassifierPlugin", "KnowledgeBasePlugin", "ResponseGeneratorPlugin"
-]
\ No newline at end of file
+]
+
+# Export name -> showcase subpackage that defines it
+_EXPORT_SUBPACKAGE = {
+    "CodeReviewerExample": "code_reviewer",
+    "StaticAnalysisPlugin": "code_reviewer",
+    "CodeMetricsPlugin": "code_reviewer",
+    "SecurityScanPlugin": "code_reviewer",
+    "ResearchAssistantExample": "research_assistant",
+    "SourceGathererPlugin": "research_assistant",
+    "FactCheckerPlugin": "research_assistant",
+    "SynthesizerPlugin": "research_assistant",
+    "CustomerServiceExample": "customer_service",
+    "IntentClassifierPlugin": "customer_service",
+    "KnowledgeBasePlugin": "customer_service",
+    "ResponseGeneratorPlugin": "customer_service",
+}
+
+
+def __getattr__(name):
+    """Import the showcase subpackage defining ``name`` on first access."""
+    subpackage = _EXPORT_SUBPACKAGE.get(name)
+    if subpackage is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{subpackage}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List loaded globals plus the lazily exported names."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,4 +1,9 @@
-"""Data analysis tool collection - Statistical and data processing plugins."""
+"""Data analysis tool collection - Statistical and data processing plugins.
+
+Internal pipelines that already hold decoded data can pass it as
+``context.parsed_payload`` instead of JSON in ``context.message``; each
+plugin's docstring gives the payload shape and what the message carries.
+"""
 
 from .statistics_calculator import StatisticsCalculatorPlugin
 from .data_validator import DataValidatorPlugin
@@ -13,6 +13,11 @@ class ChartGeneratorPlugin(ToolPlugin):
     Chart generator for creating simple text-based visualizations.
     
     Features: bar charts, histograms, simple line plots (ASCII art)
+
+    Message formats: ``chart_type:data`` or ``chart_type:labels:data``.
+    Callers holding decoded data may instead set ``context.parsed_payload``
+    to ``{"data": [...], "labels": [...]}`` (``labels`` optional) and send
+    just ``chart_type`` as the message.
     """
     
     supported_stages = [DO]
@@ -24,15 +29,22 @@ class ChartGeneratorPlugin(ToolPlugin):
         if not message:
             return "Error: No chart command provided"
         
+        payload = getattr(context, "parsed_payload", None)
+        
         try:
             # Parse: chart_type:data or chart_type:labels:data
             parts = message.split(":", 2)
-            if len(parts) < 2:
-                return "Format: chart_type:data or chart_type:labels:data"
-            
             chart_type = parts[0].lower()
             
-            if len(parts) == 2:
+            if isinstance(payload, dict):
+                # Payload carries the data (and labels); the message is chart_type
+                if len(parts) > 1:
+                    return "Error: With parsed_payload the message is just chart_type"
+                data = payload.get("data", [])
+                labels = payload.get("labels") or [str(i) for i in range(len(data))]
+            elif len(parts) < 2:
+                return "Format: chart_type:data or chart_type:labels:data"
+            elif len(parts) == 2:
                 # chart_type:data
                 data = json.loads(parts[1])
                 labels = [str(i) for i in range(len(data))]
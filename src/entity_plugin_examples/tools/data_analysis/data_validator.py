@@ -14,6 +14,10 @@ class DataValidatorPlugin(ToolPlugin):
     Data validator for data quality and format validation.
     
     Features: email validation, phone validation, data completeness
+
+    Message formats: ``validation_type:data`` or ``validate:json_data``.
+    Callers holding decoded records may instead set
+    ``context.parsed_payload`` to a list/dict; the message is then ignored.
     """
     
     supported_stages = [DO]
@@ -31,6 +35,10 @@ class DataValidatorPlugin(ToolPlugin):
     
     async def _execute_impl(self, context) -> str:
         """Execute data validation."""
+        payload = getattr(context, "parsed_payload", None)
+        if isinstance(payload, (list, dict)):
+            return self._validate_records(payload)
+        
         message = (context.message or "").strip()
         
         if not message:
@@ -69,91 +77,94 @@ class DataValidatorPlugin(ToolPlugin):
         """Validate JSON data structure."""
         try:
             data = json.loads(json_data)
+        except json.JSONDecodeError:
+            return "Error: Invalid JSON format"
+        
+        if not isinstance(data, (list, dict)):
+            return "Error: Data must be JSON object or array"
+        
+        return self._validate_records(data)
+    
+    def _validate_records(self, data: Any) -> str:
+        """Validate already-parsed records (a list of objects or a single object)."""
+        # If it's a single object, convert to list
+        if isinstance(data, dict):
+            data = [data]
+        
+        # Validation results
+        results = {
+            "total_records": len(data),
+            "valid_records": 0,
+            "invalid_records": 0,
+            "field_analysis": {},
+            "errors": []
+        }
+        
+        for i, record in enumerate(data):
+            if not isinstance(record, dict):
+                results["errors"].append(f"Record {i}: Not a valid object")
+                continue
             
-            if not isinstance(data, (list, dict)):
-                return "Error: Data must be JSON object or array"
-            
-            # If it's a single object, convert to list
-            if isinstance(data, dict):
-                data = [data]
-            
-            # Validation results
-            results = {
-                "total_records": len(data),
-                "valid_records": 0,
-                "invalid_records": 0,
-                "field_analysis": {},
-                "errors": []
-            }
+            record_valid = True
             
-            for i, record in enumerate(data):
-                if not isinstance(record, dict):
-                    results["errors"].append(f"Record {i}: Not a valid object")
-                    continue
+            for field, value in record.items():
+                if field not in results["field_analysis"]:
+                    results["field_analysis"][field] = {
+                        "total": 0,
+                        "empty": 0,
+                        "valid": 0,
+                        "type_counts": {}
+                    }
                 
-                record_valid = True
+                field_stats = results["field_analysis"][field]
+                field_stats["total"] += 1
                 
-                for field, value in record.items():
-                    if field not in results["field_analysis"]:
-                        results["field_analysis"][field] = {
-                            "total": 0,
-                            "empty": 0,
-                            "valid": 0,
-                            "type_counts": {}
-                        }
-                    
-                    field_stats = results["field_analysis"][field]
-                    field_stats["total"] += 1
-                    
-                    # Track value type
-                    value_type = type(value).__name__
-                    field_stats["type_counts"][value_type] = field_stats["type_counts"].get(value_type, 0) + 1
-                    
-                    # Check for empty values
-                    if value in [None, "", [], {}]:
-                        field_stats["empty"] += 1
-                    else:
-                        field_stats["valid"] += 1
-                        
-                        # Validate specific field types
-                        if "email" in field.lower() and isinstance(value, str):
-                            if not self.patterns["email"].match(value):
-                                results["errors"].append(f"Record {i}: Invalid email in field '{field}': {value}")
-                                record_valid = False
-                        
-                        elif "phone" in field.lower() and isinstance(value, str):
-                            if not self.patterns["phone"].match(value):
-                                results["errors"].append(f"Record {i}: Invalid phone in field '{field}': {value}")
-                                record_valid = False
+                # Track value type
+                value_type = type(value).__name__
+                field_stats["type_counts"][value_type] = field_stats["type_counts"].get(value_type, 0) + 1
                 
-                if record_valid:
-                    results["valid_records"] += 1
+                # Check for empty values
+                if value is None or (isinstance(value, (str, list, dict)) and not value):
+                    field_stats["empty"] += 1
                 else:
-                    results["invalid_records"] += 1
-            
-            # Format output
-            output = ["📋 **Data Validation Results:**\n"]
-            output.append(f"**Total Records:** {results['total_records']}")
-            output.append(f"**Valid Records:** {results['valid_records']}")
-            output.append(f"**Invalid Records:** {results['invalid_records']}")
-            
-            if results["field_analysis"]:
-                output.append("\n**Field Analysis:**")
-                for field, stats in results["field_analysis"].items():
-                    completeness = (stats["valid"] / stats["total"] * 100) if stats["total"] > 0 else 0
-                    output.append(f"• **{field}:** {completeness:.1f}% complete ({stats['valid']}/{stats['total']})")
-            
-            if results["errors"]:
-                output.append(f"\n**Validation Errors ({len(results['errors'])}):**")
-                for error in results["errors"][:5]:  # Show first 5 errors
-                    output.append(f"• {error}")
-                if len(results["errors"]) > 5:
-                    output.append(f"• ... and {len(results['errors']) - 5} more errors")
-            
-            return "\n".join(output)
+                    field_stats["valid"] += 1
+                    
+                    # Validate specific field types
+                    if "email" in field.lower() and isinstance(value, str):
+                        if not self.patterns["email"].match(value):
+                            results["errors"].append(f"Record {i}: Invalid email in field '{field}': {value}")
+                            record_valid = False
+                    
+                    elif "phone" in field.lower() and isinstance(value, str):
+                        if not self.patterns["phone"].match(value):
+                            results["errors"].append(f"Record {i}: Invalid phone in field '{field}': {value}")
+                            record_valid = False
             
-        except json.JSONDecodeError:
-            return "Error: Invalid JSON format"
+            if record_valid:
+                results["valid_records"] += 1
+            else:
+                results["invalid_records"] += 1
+        
+        # Format output
+        output = ["📋 **Data Validation Results:**\n"]
+        output.append(f"**Total Records:** {results['total_records']}")
+        output.append(f"**Valid Records:** {results['valid_records']}")
+        output.append(f"**Invalid Records:** {results['invalid_records']}")
+        
+        if results["field_analysis"]:
+            output.append("\n**Field Analysis:**")
+            for field, stats in results["field_analysis"].items():
+                completeness = (stats["valid"] / stats["total"] * 100) if stats["total"] > 0 else 0
+                output.append(f"• **{field}:** {completeness:.1f}% complete ({stats['valid']}/{stats['total']})")
+        
+        if results["errors"]:
+            output.append(f"\n**Validation Errors ({len(results['errors'])}):**")
+            for error in results["errors"][:5]:  # Show first 5 errors
+                output.append(f"• {error}")
+            if len(results["errors"]) > 5:
+                output.append(f"• ... and {len(results['errors']) - 5} more errors")
+        
+        return "\n".join(output)
 
 
 # Example: await plugin._execute_impl(Mock(message="email:test@example.com"))
@@ -14,20 +14,25 @@ class StatisticsCalculatorPlugin(ToolPlugin):
     Statistics calculator for basic statistical analysis.
     
     Features: mean, median, mode, std dev, min/max, percentiles
+
+    Message format: a JSON array of numbers. Callers holding decoded data
+    may instead set ``context.parsed_payload`` to the list; the message is
+    then ignored.
     """
     
     supported_stages = [DO]
     
     async def _execute_impl(self, context) -> str:
         """Execute statistical calculations."""
-        message = (context.message or "").strip()
+        payload = getattr(context, "parsed_payload", None)
+        message = "" if isinstance(payload, list) else (context.message or "").strip()
         
-        if not message:
+        if not message and not isinstance(payload, list):
             return "Error: No data provided for analysis"
         
         try:
             # Parse input - expect JSON array of numbers
-            data = json.loads(message)
+            data = payload if isinstance(payload, list) else json.loads(message)
             
             if not isinstance(data, list):
                 return "Error: Data must be a JSON array of numbers"
@@ -15,6 +15,10 @@ class FileConverterPlugin(ToolPlugin):
     File converter for format conversions.
     
     Features: JSON to CSV, CSV to JSON, format validation
+
+    Message format: ``from_format:to_format:data``. Callers holding decoded
+    JSON records may instead set ``context.parsed_payload`` to a list/dict
+    and send just ``json:csv`` as the message.
     """
     
     supported_stages = [DO]
@@ -26,7 +30,15 @@ class FileConverterPlugin(ToolPlugin):
         if not message:
             return "Error: No conversion command provided"
         
+        payload = getattr(context, "parsed_payload", None)
+
         try:
+            # Payload carries the JSON records; the message is json:csv
+            if isinstance(payload, (list, dict)):
+                if message.lower() != "json:csv":
+                    return "Error: With parsed_payload the message must be 'json:csv'"
+                return self._records_to_csv(payload)
+
             # Parse: from_format:to_format:data
             parts = message.split(":", 2)
             if len(parts) != 3:
@@ -48,25 +60,29 @@ class FileConverterPlugin(ToolPlugin):
         """Convert JSON to CSV format."""
         try:
             data = json.loads(json_data)
-            if not isinstance(data, list):
-                data = [data]
-            
-            if not data:
-                return "CSV:\n(empty)"
-            
-            # Get headers from first object
-            headers = list(data[0].keys())
-            
-            # Create CSV
-            output = StringIO()
-            writer = csv.DictWriter(output, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(data)
-            
-            return f"CSV:\n{output.getvalue()}"
-            
         except json.JSONDecodeError:
             return "Error: Invalid JSON data"
+        
+        return self._records_to_csv(data)
+    
+    def _records_to_csv(self, data: Any) -> str:
+        """Convert already-parsed records to CSV format."""
+        if not isinstance(data, list):
+            data = [data]
+        
+        if not data:
+            return "CSV:\n(empty)"
+        
+        # Get headers from first object
+        headers = list(data[0].keys())
+        
+        # Create CSV
+        output = StringIO()
+        writer = csv.DictWriter(output, fieldnames=headers)
+        writer.writeheader()
+        writer.writerows(data)
+        
+        return f"CSV:\n{output.getvalue()}"
     
     def _csv_to_json(self, csv_data: str) -> str:
         """Convert CSV to JSON format."""
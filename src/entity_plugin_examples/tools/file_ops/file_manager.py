@@ -3,14 +3,26 @@
 from __future__ import annotations
 import os
 import shutil
+import stat as stat_module
 import tempfile
-from pathlib import Path
+from datetime import datetime as _dt
 from typing import Dict, Any, Optional, List
 import json
 
 from entity.plugins.tool import ToolPlugin
 from entity.workflow.stages import DO
 
+_fromtimestamp = _dt.fromtimestamp
+
+
+def _ext(name: str) -> str:
+    """Return the lowercased extension of a file name or path (like Path.suffix)."""
+    base = name.rfind(os.sep) + 1
+    dot = name.rfind(".")
+    if dot <= base or dot == len(name) - 1:
+        return ""
+    return name[dot:].lower()
+
 
 class FileManagerPlugin(ToolPlugin):
     """
@@ -35,17 +47,37 @@ class FileManagerPlugin(ToolPlugin):
         # Security: Restrict operations to allowed directories
         self.allowed_directories = config.get("allowed_directories", [tempfile.gettempdir()])
         self.max_file_size = config.get("max_file_size", 10 * 1024 * 1024)  # 10MB
-        self.allowed_extensions = config.get("allowed_extensions", [
+        self.allowed_extensions = frozenset(ext.lower() for ext in config.get("allowed_extensions", [
             ".txt", ".md", ".json", ".csv", ".log", ".yaml", ".yml", ".xml"
-        ])
+        ]))
+        self._allowed_extensions_display = sorted(self.allowed_extensions)
         self.read_only_mode = config.get("read_only_mode", True)
         
         # Ensure allowed directories exist and are absolute
         self.allowed_directories = [os.path.abspath(d) for d in self.allowed_directories]
+        # Trailing separator keeps "/tmpfoo" from matching "/tmp"
+        self._allowed_prefixes = tuple(d.rstrip(os.sep) + os.sep for d in self.allowed_directories)
+        
+        # Operation dispatch table (aliases share a handler)
+        self._ops = {
+            "ls": self._list_directory,
+            "list": self._list_directory,
+            "read": self._read_file,
+            "cat": self._read_file,
+            "info": self._get_file_info,
+            "stat": self._get_file_info,
+            "mkdir": self._create_directory,
+            "copy": self._copy_file,
+            "cp": self._copy_file,
+            "help": lambda _: self._show_help(),
+        }
     
     async def _execute_impl(self, context) -> str:
         """Execute file management operations."""
-        command = (context.message or "").strip()
+        # Only strip non-empty messages; empty input goes straight to the early return
+        command = context.message
+        if command:
+            command = command.strip()
         
         if not command:
             return self._show_help()
@@ -57,20 +89,10 @@ class FileManagerPlugin(ToolPlugin):
             args = parts[1] if len(parts) > 1 else ""
             
             # Route to appropriate operation
-            if operation == "ls" or operation == "list":
-                return self._list_directory(args or ".")
-            elif operation == "read" or operation == "cat":
-                return self._read_file(args)
-            elif operation == "info" or operation == "stat":
-                return self._get_file_info(args)
-            elif operation == "mkdir":
-                return self._create_directory(args)
-            elif operation == "copy" or operation == "cp":
-                return self._copy_file(args)
-            elif operation == "help":
-                return self._show_help()
-            else:
+            handler = self._ops.get(operation)
+            if handler is None:
                 return f"Unknown operation: {operation}. Use 'help' for available commands."
+            return handler(args)
                 
         except Exception as e:
             return f"File Operation Error: {str(e)}"
@@ -83,18 +105,8 @@ class FileManagerPlugin(ToolPlugin):
         # Convert to absolute path
         abs_path = os.path.abspath(path)
         
-        # Check if path is within allowed directories
-        allowed = False
-        for allowed_dir in self.allowed_directories:
-            try:
-                # Check if the path is under an allowed directory
-                os.path.relpath(abs_path, allowed_dir)
-                if abs_path.startswith(allowed_dir):
-                    allowed = True
-                    break
-            except ValueError:
-                # Different drives on Windows
-                continue
+        # Check if path is (or is under) an allowed directory
+        allowed = abs_path in self.allowed_directories or abs_path.startswith(self._allowed_prefixes)
         
         if not allowed:
             raise PermissionError(f"Path '{path}' is not within allowed directories")
@@ -102,7 +114,8 @@ class FileManagerPlugin(ToolPlugin):
         return abs_path
     
     def _list_directory(self, path: str) -> str:
-        """List directory contents."""
+        """List directory contents (the current directory if path is empty)."""
+        path = path or "."
         try:
             validated_path = self._validate_path(path)
             
@@ -116,55 +129,59 @@ class FileManagerPlugin(ToolPlugin):
             total_size = 0
             
             try:
-                for item_name in sorted(os.listdir(validated_path)):
-                    item_path = os.path.join(validated_path, item_name)
-                    
-                    try:
-                        stat = os.stat(item_path)
-                        is_dir = os.path.isdir(item_path)
-                        size = stat.st_size if not is_dir else 0
+                with os.scandir(validated_path) as entries:
+                    for entry in entries:
+                        item_name = entry.name
                         
-                        total_size += size
-                        
-                        # Format size
-                        if is_dir:
-                            size_str = "<DIR>"
-                        else:
-                            size_str = self._format_size(size)
-                        
-                        # Get extension
-                        ext = Path(item_name).suffix.lower() if not is_dir else ""
-                        
-                        items.append({
-                            "name": item_name,
-                            "type": "directory" if is_dir else "file",
-                            "size": size,
-                            "size_str": size_str,
-                            "extension": ext,
-                            "accessible": True
-                        })
-                        
-                    except PermissionError:
-                        items.append({
-                            "name": item_name,
-                            "type": "unknown",
-                            "size": 0,
-                            "size_str": "N/A",
-                            "extension": "",
-                            "accessible": False
-                        })
+                        try:
+                            # DirEntry caches the file type from the directory scan,
+                            # so only files need a stat() call for their size
+                            is_dir = entry.is_dir()
+                            size = entry.stat().st_size if not is_dir else 0
+                            
+                            total_size += size
+                            
+                            # Format size
+                            if is_dir:
+                                size_str = "<DIR>"
+                            else:
+                                size_str = self._format_size(size)
+                            
+                            # Get extension
+                            ext = _ext(item_name) if not is_dir else ""
+                            
+                            items.append({
+                                "name": item_name,
+                                "type": "directory" if is_dir else "file",
+                                "size": size,
+                                "size_str": size_str,
+                                "extension": ext,
+                                "accessible": True
+                            })
+                            
+                        except PermissionError:
+                            items.append({
+                                "name": item_name,
+                                "type": "unknown",
+                                "size": 0,
+                                "size_str": "N/A",
+                                "extension": "",
+                                "accessible": False
+                            })
             
             except PermissionError:
                 return f"Permission denied: Cannot list directory {path}"
             
+            items.sort(key=lambda item: item["name"])
+            
             # Format output
             output = [f"📁 **Directory listing for:** {path}"]
             output.append(f"**Path:** {validated_path}")
-            output.append(f"**Items:** {len(items)} | **Total size:** {self._format_size(total_size)}\\n")
+            output.append(f"**Items:** {len(items)} | **Total size:** {self._format_size(total_size)}\n")
             
             if not items:
                 output.append("(Empty directory)")
-                return "\\n".join(output)
+                return "\n".join(output)
             
             # Group by type
             directories = [item for item in items if item["type"] == "directory"]
@@ -189,7 +206,7 @@ class FileManagerPlugin(ToolPlugin):
                     
                     output.append(f"  {icon} {item['name']} ({item['size_str']})")
             
-            return "\\n".join(output)
+            return "\n".join(output)
             
         except Exception as e:
             return f"Error listing directory: {str(e)}"
@@ -202,41 +219,43 @@ class FileManagerPlugin(ToolPlugin):
             
             validated_path = self._validate_path(path)
             
-            if not os.path.exists(validated_path):
+            try:
+                stat = os.stat(validated_path)
+            except FileNotFoundError:
                 return f"File does not exist: {path}"
             
-            if not os.path.isfile(validated_path):
+            if not stat_module.S_ISREG(stat.st_mode):
                 return f"Path is not a file: {path}"
             
             # Check file size
-            file_size = os.path.getsize(validated_path)
+            file_size = stat.st_size
             if file_size > self.max_file_size:
                 return f"File too large: {self._format_size(file_size)} (max: {self._format_size(self.max_file_size)})"
             
             # Check extension
-            file_ext = Path(validated_path).suffix.lower()
+            file_ext = _ext(validated_path)
             if file_ext not in self.allowed_extensions:
-                return f"File type not allowed: {file_ext}. Allowed: {', '.join(self.allowed_extensions)}"
+                return f"File type not allowed: {file_ext}. Allowed: {', '.join(self._allowed_extensions_display)}"
             
             # Read file
             try:
+                # Only read what can be displayed, plus one char to detect truncation
+                max_display = 2000
                 with open(validated_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                    content = f.read(max_display + 1)
                 
-                # Truncate if too long for display
-                max_display = 2000
                 if len(content) > max_display:
-                    content = content[:max_display] + "\\n\\n... (truncated)"
+                    content = content[:max_display] + "\n\n... (truncated)"
                 
-                output = [f"📄 **File contents:** {path}"]
-                output.append(f"**Path:** {validated_path}")
-                output.append(f"**Size:** {self._format_size(file_size)}")
-                output.append(f"**Extension:** {file_ext}\\n")
-                output.append("```")
-                output.append(content)
-                output.append("```")
-                
-                return "\\n".join(output)
+                return "\n".join((
+                    f"📄 **File contents:** {path}",
+                    f"**Path:** {validated_path}",
+                    f"**Size:** {self._format_size(file_size)}",
+                    f"**Extension:** {file_ext}\n",
+                    "```",
+                    content,
+                    "```",
+                ))
                 
             except UnicodeDecodeError:
                 return f"Error: File appears to be binary or uses unsupported encoding: {path}"
@@ -252,11 +271,12 @@ class FileManagerPlugin(ToolPlugin):
             
             validated_path = self._validate_path(path)
             
-            if not os.path.exists(validated_path):
+            try:
+                stat = os.stat(validated_path)
+            except FileNotFoundError:
                 return f"Path does not exist: {path}"
             
-            stat = os.stat(validated_path)
-            is_dir = os.path.isdir(validated_path)
+            is_dir = stat_module.S_ISDIR(stat.st_mode)
             
             output = [f"ℹ️  **Path information:** {path}"]
             output.append(f"**Full path:** {validated_path}")
@@ -266,11 +286,11 @@ class FileManagerPlugin(ToolPlugin):
             output.append(f"**Accessed:** {self._format_timestamp(stat.st_atime)}")
             
             if not is_dir:
-                file_ext = Path(validated_path).suffix.lower()
+                file_ext = _ext(validated_path)
                 output.append(f"**Extension:** {file_ext if file_ext else '(none)'}")
                 output.append(f"**Readable:** {'Yes' if file_ext in self.allowed_extensions else 'No (extension not allowed)'}")
             
-            return "\\n".join(output)
+            return "\n".join(output)
             
         except Exception as e:
             return f"Error getting file info: {str(e)}"
@@ -286,10 +306,12 @@ class FileManagerPlugin(ToolPlugin):
             
             validated_path = self._validate_path(path)
             
-            if os.path.exists(validated_path):
+            # Let makedirs report an existing path instead of checking first
+            try:
+                os.makedirs(validated_path)
+            except FileExistsError:
                 return f"Path already exists: {path}"
             
-            os.makedirs(validated_path, exist_ok=True)
             return f"✅ Created directory: {path}"
             
         except Exception as e:
@@ -325,49 +347,39 @@ class FileManagerPlugin(ToolPlugin):
         """Show available commands."""
         mode_str = "read-only" if self.read_only_mode else "read-write"
         
-        commands = [
+        write_commands = () if self.read_only_mode else (
+            "• `mkdir <path>` - Create directory",
+            "• `copy <src> <dst>` or `cp <src> <dst>` - Copy file",
+        )
+        
+        return "\n".join((
             "📋 **File Manager Commands:**",
             f"**Mode:** {mode_str}",
-            f"**Allowed directories:** {', '.join(self.allowed_directories)}\\n",
+            f"**Allowed directories:** {', '.join(self.allowed_directories)}\n",
             
             "**Available commands:**",
             "• `ls [path]` or `list [path]` - List directory contents",
             "• `read <file>` or `cat <file>` - Read file contents",
             "• `info <path>` or `stat <path>` - Get file/directory information",
-        ]
-        
-        if not self.read_only_mode:
-            commands.extend([
-                "• `mkdir <path>` - Create directory",
-                "• `copy <src> <dst>` or `cp <src> <dst>` - Copy file",
-            ])
-        
-        commands.extend([
-            "• `help` - Show this help message\\n",
+            *write_commands,
+            "• `help` - Show this help message\n",
             
-            f"**Supported file types:** {', '.join(self.allowed_extensions)}",
-            f"**Maximum file size:** {self._format_size(self.max_file_size)}"
-        ])
-        
-        return "\\n".join(commands)
+            f"**Supported file types:** {', '.join(self._allowed_extensions_display)}",
+            f"**Maximum file size:** {self._format_size(self.max_file_size)}",
+        ))
     
     def _format_size(self, size_bytes: int) -> str:
         """Format file size in human readable format."""
-        if size_bytes == 0:
+        if size_bytes <= 0:
             return "0 B"
         
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024
-        
-        return f"{size_bytes:.1f} TB"
+        # Each unit spans 10 bits, so bit_length picks the unit directly
+        i = min((int(size_bytes).bit_length() - 1) // 10, 4)
+        return f"{size_bytes / (1 << (i * 10)):.1f} {('B', 'KB', 'MB', 'GB', 'TB')[i]}"
     
     def _format_timestamp(self, timestamp: float) -> str:
         """Format timestamp in readable format."""
-        import datetime
-        dt = datetime.datetime.fromtimestamp(timestamp)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return _fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
 
 
 # Example usage:
@@ -8,6 +8,12 @@ from entity.plugins.tool import ToolPlugin
 from entity.workflow.stages import DO
 
 
+def _count(text: str) -> tuple[int, int, int]:
+    """Return (words, characters, lines) for text."""
+    # str.split()/str.count run in C; only the word split allocates a list
+    return len(text.split()), len(text), text.count("\n") + 1
+
+
 class TextProcessorPlugin(ToolPlugin):
     """
     Text processor for common text manipulation tasks.
@@ -34,12 +40,12 @@ class TextProcessorPlugin(ToolPlugin):
             text_part = parts[1]
             
             if operation == "wordcount":
-                words = len(text_part.split())
-                chars = len(text_part)
-                lines = len(text_part.split('\n'))
+                words, chars, lines = _count(text_part)
                 return f"Words: {words}, Characters: {chars}, Lines: {lines}"
             
             elif operation == "upper":
+                # str.upper()/lower() already take CPython's ASCII fast path,
+                # which is faster than str.translate with a case table
                 return text_part.upper()
             
             elif operation == "lower":
@@ -54,6 +60,9 @@ class TextProcessorPlugin(ToolPlugin):
                 if len(replace_parts) != 3:
                     return "Format: replace:pattern:replacement:text"
                 pattern, replacement, text = replace_parts
+                # ASCII str objects are stored one byte per char, so str.replace
+                # already runs the same fast search as bytes.replace without
+                # the encode/decode copies
                 return text.replace(pattern, replacement)
             
             else:
@@ -1,6 +1,7 @@
 """Search engine plugin for web searches (simulated)."""
 
 from __future__ import annotations
+import bisect
 import json
 import re
 from typing import Dict, Any, Optional, List
@@ -9,6 +10,10 @@ from urllib.parse import quote_plus
 from entity.plugins.tool import ToolPlugin
 from entity.workflow.stages import DO
 
+_QUOTE_RE = re.compile(r'"([^"]*)"')
+_WORD_RE = re.compile(r"\w+")
+_OPERATORS = ((" site:", "site"), (" filetype:", "filetype"))
+
 
 class SearchEnginePlugin(ToolPlugin):
     """
@@ -20,6 +25,32 @@ class SearchEnginePlugin(ToolPlugin):
     
     supported_stages = [DO]
     
+    # Common programming-related suggestions
+    common_terms = (
+        "python tutorial", "machine learning", "web development",
+        "data science", "artificial intelligence", "software engineering",
+        "javascript", "react", "node.js", "docker", "kubernetes"
+    )
+    
+    # (title, url, snippet) templates for queries without demo results
+    _generic_templates = (
+        (
+            "Search results for '{q}' - Wikipedia",
+            "https://en.wikipedia.org/wiki/Special:Search?search={eq}",
+            "Wikipedia articles related to {q}",
+        ),
+        (
+            "{q} - Stack Overflow",
+            "https://stackoverflow.com/search?q={eq}",
+            "Programming questions and answers about {q}",
+        ),
+        (
+            "{q} - GitHub",
+            "https://github.com/search?q={eq}",
+            "Open source projects related to {q}",
+        ),
+    )
+    
     def __init__(self, resources: Dict[str, Any], config: Optional[Dict[str, Any]] = None):
         super().__init__(resources, config)
         
@@ -46,10 +77,23 @@ class SearchEnginePlugin(ToolPlugin):
                 {"title": "PyTorch", "url": "https://pytorch.org", "snippet": "Deep learning framework"}
             ]
         }
+        
+        # Inverted index: each word of a demo query -> demo entry positions
+        self._demo_entries = list(self.demo_results.items())
+        self._token_index: Dict[str, List[int]] = {}
+        for i, demo_query in enumerate(self.demo_results):
+            for token in set(_WORD_RE.findall(demo_query)):
+                self._token_index.setdefault(token, []).append(i)
+        
+        # Sorted suggestion corpus for bisect prefix lookups
+        self._suggestion_corpus = sorted(set(self.demo_results) | set(self.common_terms))
     
     async def _execute_impl(self, context) -> str:
         """Execute web search."""
-        query = (context.message or "").strip()
+        # Only strip non-empty messages; empty input goes straight to the early return
+        query = context.message
+        if query:
+            query = query.strip()
         
         if not query:
             return "Error: Empty search query"
@@ -75,21 +119,22 @@ class SearchEnginePlugin(ToolPlugin):
             "language": self.language
         }
         
-        # Handle special search operators
-        if " site:" in query:
-            parts = query.split(" site:")
-            params["query"] = parts[0].strip()
-            params["site"] = parts[1].strip()
+        # Handle special search operators; the query text ends at the first one
+        query_end = len(query)
+        for operator, key in _OPERATORS:
+            idx = query.find(operator)
+            if idx >= 0:
+                params[key] = query[idx + len(operator):].split(" ", 1)[0]
+                query_end = min(query_end, idx)
         
-        if " filetype:" in query:
-            parts = query.split(" filetype:")
-            params["query"] = parts[0].strip()
-            params["filetype"] = parts[1].strip()
+        if query_end < len(query):
+            params["query"] = query[:query_end].strip()
         
-        # Handle quoted phrases
-        quoted_phrases = re.findall(r'"([^"]*)"', query)
-        if quoted_phrases:
-            params["exact_phrases"] = quoted_phrases
+        # Handle quoted phrases (skip the regex when there are no quotes)
+        if '"' in query:
+            quoted_phrases = _QUOTE_RE.findall(query)
+            if quoted_phrases:
+                params["exact_phrases"] = quoted_phrases
         
         return params
     
@@ -97,12 +142,15 @@ class SearchEnginePlugin(ToolPlugin):
         """Perform search and return results (simulated)."""
         query_lower = query.lower()
         
-        # Find matching demo results
-        results = []
+        # Find matching demo results (kept in demo_results order); words are
+        # tokenized the same way as the index, so punctuation doesn't block a match
+        matched = set()
+        for token in set(_WORD_RE.findall(query_lower)):
+            matched.update(self._token_index.get(token, ()))
         
-        for demo_query, demo_results in self.demo_results.items():
-            if demo_query in query_lower or any(word in query_lower for word in demo_query.split()):
-                results.extend(demo_results)
+        results = []
+        for i in sorted(matched):
+            results.extend(self._demo_entries[i][1])
         
         # If no demo results found, generate generic results
         if not results:
@@ -117,20 +165,11 @@ class SearchEnginePlugin(ToolPlugin):
         
         return [
             {
-                "title": f"Search results for '{query}' - Wikipedia",
-                "url": f"https://en.wikipedia.org/wiki/Special:Search?search={encoded_query}",
-                "snippet": f"Wikipedia articles related to {query}"
-            },
-            {
-                "title": f"{query} - Stack Overflow",
-                "url": f"https://stackoverflow.com/search?q={encoded_query}",
-                "snippet": f"Programming questions and answers about {query}"
-            },
-            {
-                "title": f"{query} - GitHub",
-                "url": f"https://github.com/search?q={encoded_query}",
-                "snippet": f"Open source projects related to {query}"
+                "title": title.format(q=query),
+                "url": url.format(eq=encoded_query),
+                "snippet": snippet.format(q=query),
             }
+            for title, url, snippet in self._generic_templates
         ]
     
     def _format_search_results(self, query: str, results: List[Dict[str, str]]) -> str:
@@ -150,42 +189,32 @@ class SearchEnginePlugin(ToolPlugin):
     def search_with_filters(self, query: str, **filters) -> str:
         """Search with additional filters."""
         # Apply filters like site:, filetype:, date range, etc.
-        filtered_query = query
+        parts = [query]
         
         if "site" in filters:
-            filtered_query += f" site:{filters['site']}"
+            parts.append(f"site:{filters['site']}")
         
         if "filetype" in filters:
-            filtered_query += f" filetype:{filters['filetype']}"
+            parts.append(f"filetype:{filters['filetype']}")
         
         if "exclude" in filters:
-            for term in filters["exclude"]:
-                filtered_query += f" -{term}"
+            parts.extend(f"-{term}" for term in filters["exclude"])
         
-        return filtered_query
+        return " ".join(parts)
     
     def get_search_suggestions(self, partial_query: str) -> List[str]:
         """Get search suggestions for partial query."""
         suggestions = []
         partial_lower = partial_query.lower()
+        corpus = self._suggestion_corpus
         
-        # Check demo queries for matches
-        for demo_query in self.demo_results.keys():
-            if demo_query.startswith(partial_lower):
-                suggestions.append(demo_query)
-        
-        # Add common programming-related suggestions
-        common_terms = [
-            "python tutorial", "machine learning", "web development",
-            "data science", "artificial intelligence", "software engineering",
-            "javascript", "react", "node.js", "docker", "kubernetes"
-        ]
-        
-        for term in common_terms:
-            if term.startswith(partial_lower) and term not in suggestions:
-                suggestions.append(term)
+        # Prefix matches are contiguous in the sorted corpus
+        i = bisect.bisect_left(corpus, partial_lower)
+        while i < len(corpus) and len(suggestions) < 5 and corpus[i].startswith(partial_lower):
+            suggestions.append(corpus[i])
+            i += 1
         
-        return suggestions[:5]  # Limit to 5 suggestions
+        return suggestions
 
 
 # Example usage:
@@ -1,6 +1,7 @@
 """Web scraper plugin for extracting content from web pages (simulated)."""
 
 from __future__ import annotations
+import asyncio
 import re
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse, urljoin
@@ -8,6 +9,62 @@ from urllib.parse import urlparse, urljoin
 from entity.plugins.tool import ToolPlugin
 from entity.workflow.stages import DO
 
+_LEAF = "$"  # never a valid hostname label
+
+
+class _DomainTrie:
+    """Map domain suffixes to values, matched on whole labels from the right."""
+    
+    def __init__(self) -> None:
+        self._root: Dict[str, Any] = {}
+    
+    def insert(self, domain: str, value: Any) -> None:
+        node = self._root
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[_LEAF] = value
+    
+    def longest_match(self, host: str) -> Optional[Any]:
+        """Return the value registered for the longest suffix of host, if any."""
+        found = None
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            found = node.get(_LEAF, found)
+        return found
+
+
+# Simulated page templates; "{page}" is the last path segment, or the
+# fallback when the URL has no path ("{page_words}" has "_" as spaces)
+_DOCS_TEMPLATE = {
+    "title": "Documentation",
+    "fallback": "",
+    "content": "Technical documentation with tutorials, guides, and API reference.",
+    "headers": ["Getting Started", "Tutorials", "API Reference", "Examples"],
+}
+_PAGE_TEMPLATES = _DomainTrie()
+_PAGE_TEMPLATES.insert("github.com", {
+    "title": "GitHub Repository - {page}",
+    "fallback": "Repository",
+    "content": "Open source repository with code, issues, documentation and collaboration features.",
+    "headers": ["README", "Code", "Issues", "Pull Requests"],
+})
+_PAGE_TEMPLATES.insert("stackoverflow.com", {
+    "title": "Stack Overflow - Programming Q&A",
+    "fallback": "",
+    "content": "Programming questions and answers from the developer community.",
+    "headers": ["Questions", "Answers", "Tags", "Users"],
+})
+_PAGE_TEMPLATES.insert("wikipedia.org", {
+    "title": "Wikipedia Article - {page_words}",
+    "fallback": "Article",
+    "content": "Encyclopedia article with comprehensive information and references.",
+    "headers": ["Contents", "References", "External Links"],
+})
+_PAGE_TEMPLATES.insert("readthedocs.io", _DOCS_TEMPLATE)
+
 
 class WebScraperPlugin(ToolPlugin):
     """
@@ -86,39 +143,37 @@ class WebScraperPlugin(ToolPlugin):
     
     def _scrape_url(self, url: str) -> Optional[Dict[str, Any]]:
         """Scrape content from URL (simulated)."""
-        # Check if we have demo content for this URL
-        if url in self.demo_content:
-            return self.demo_content[url]
+        # Check if we have demo content for this URL (one lookup; the literal
+        # keys are already interned, and interning url would hash it anyway)
+        content = self.demo_content.get(url)
+        if content is not None:
+            return content
         
         # Generate simulated content for unknown URLs
         return self._generate_simulated_content(url)
     
+    async def _scrape_url_async(self, url: str) -> Optional[Dict[str, Any]]:
+        """Scrape content from URL without blocking the event loop (simulated)."""
+        # In production this would await an HTTP request instead
+        return self._scrape_url(url)
+    
     def _generate_simulated_content(self, url: str) -> Dict[str, Any]:
         """Generate simulated content for demonstration."""
         parsed = urlparse(url)
         domain = parsed.netloc.lower()
         path = parsed.path
         
-        # Generate content based on domain patterns
-        if "github.com" in domain:
-            title = f"GitHub Repository - {path.split('/')[-1] if path else 'Repository'}"
-            content = "Open source repository with code, issues, documentation and collaboration features."
-            headers = ["README", "Code", "Issues", "Pull Requests"]
-            
-        elif "stackoverflow.com" in domain:
-            title = "Stack Overflow - Programming Q&A"
-            content = "Programming questions and answers from the developer community."
-            headers = ["Questions", "Answers", "Tags", "Users"]
-            
-        elif "wikipedia.org" in domain:
-            title = f"Wikipedia Article - {path.split('/')[-1].replace('_', ' ') if path else 'Article'}"
-            content = "Encyclopedia article with comprehensive information and references."
-            headers = ["Contents", "References", "External Links"]
-            
-        elif "readthedocs.io" in domain or "docs." in domain:
-            title = "Documentation"
-            content = "Technical documentation with tutorials, guides, and API reference."
-            headers = ["Getting Started", "Tutorials", "API Reference", "Examples"]
+        # Pick a template by domain suffix, then by a "docs." subdomain
+        host = domain.rpartition("@")[2].partition(":")[0]
+        template = _PAGE_TEMPLATES.longest_match(host)
+        if template is None and "docs" in host.split(".")[:-1]:
+            template = _DOCS_TEMPLATE
+        
+        if template is not None:
+            page = path.split('/')[-1] if path else template["fallback"]
+            title = template["title"].format(page=page, page_words=page.replace('_', ' '))
+            content = template["content"]
+            headers = list(template["headers"])
             
         else:
             # Generic content
@@ -161,8 +216,10 @@ class WebScraperPlugin(ToolPlugin):
         # Headers
         if "headers" in data and data["headers"]:
             output.append("📋 **Page Headers:**")
-            for i, header in enumerate(data["headers"][:5], 1):  # Limit to 5 headers
-                output.append(f"  {i}. {header}")
+            output.extend(
+                f"  {i}. {header}"
+                for i, header in enumerate(data["headers"][:5], 1)  # Limit to 5 headers
+            )
             output.append("")
         
         # Content preview
@@ -171,25 +228,28 @@ class WebScraperPlugin(ToolPlugin):
             if len(content) > self.max_content_length:
                 content = content[:self.max_content_length] + "..."
             
-            output.append("📖 **Content Preview:**")
-            output.append(f"```\n{content}\n```")
-            output.append("")
+            # Fences go in as their own lines so the content is copied only by the join
+            output.extend(("📖 **Content Preview:**", "```", content, "```", ""))
         
         # Links
         if self.extract_links and "links" in data and data["links"]:
             output.append("🔗 **Extracted Links:**")
-            for i, link in enumerate(data["links"][:5], 1):  # Limit to 5 links
-                output.append(f"  {i}. {link}")
+            output.extend(
+                f"  {i}. {link}"
+                for i, link in enumerate(data["links"][:5], 1)  # Limit to 5 links
+            )
             
             if len(data["links"]) > 5:
                 output.append(f"  ... and {len(data['links']) - 5} more links")
             output.append("")
         
         # Statistics
-        output.append("📊 **Scraping Statistics:**")
-        output.append(f"- Content length: {len(data.get('content', ''))} characters")
-        output.append(f"- Headers found: {len(data.get('headers', []))}")
-        output.append(f"- Links found: {len(data.get('links', []))}")
+        output.extend((
+            "📊 **Scraping Statistics:**",
+            f"- Content length: {len(data.get('content', ''))} characters",
+            f"- Headers found: {len(data.get('headers', []))}",
+            f"- Links found: {len(data.get('links', []))}",
+        ))
         
         return "\n".join(output)
     
@@ -214,10 +274,35 @@ class WebScraperPlugin(ToolPlugin):
         else:
             return []
     
+    async def batch_scrape_async(
+        self, urls: List[str], concurrency: int = 6
+    ) -> Dict[str, Dict[str, Any]]:
+        """Scrape multiple URLs concurrently, at most `concurrency` at a time."""
+        if concurrency < 1:
+            # Semaphore(0) would never be acquired and the batch would hang
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def scrape_one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    scraped_data = await self._scrape_url_async(url)
+                except Exception as e:
+                    # Only ordinary errors become results; cancellation propagates
+                    return {"error": str(e)}
+            return scraped_data or {"error": "Could not scrape content"}
+
+        scraped = await asyncio.gather(*(scrape_one(url) for url in urls))
+        return dict(zip(urls, scraped))
+
     def batch_scrape(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
-        """Scrape multiple URLs (simulated batch processing)."""
+        """Scrape multiple URLs (simulated batch processing).
+
+        Runs one URL at a time, so it is safe to call from inside a running
+        event loop; async code can await batch_scrape_async() instead.
+        """
         results = {}
-        
+
         for url in urls:
             try:
                 scraped_data = self._scrape_url(url)
@@ -227,7 +312,7 @@ class WebScraperPlugin(ToolPlugin):
                     results[url] = {"error": "Could not scrape content"}
             except Exception as e:
                 results[url] = {"error": str(e)}
-        
+
         return results
     
     def get_scraping_stats(self) -> Dict[str, Any]:
@@ -256,9 +341,9 @@ await scraper._execute_impl(Mock(message="https://www.python.org"))
 headers = scraper.extract_specific_content("https://www.python.org", "headers")
 links = scraper.extract_specific_content("https://www.python.org", "links")
 
-# Batch scraping
+# Batch scraping (concurrent; batch_scrape() is the sequential version)
 urls = ["https://www.python.org", "https://github.com/ladvien/entity"]
-batch_results = scraper.batch_scrape(urls)
+batch_results = await scraper.batch_scrape_async(urls, concurrency=6)
 
 # Get scraping statistics
 stats = scraper.get_scraping_stats()
@@ -0,0 +1,149 @@
+"""Shared fixtures for the plugin example tests.
+
+Tests that read example source through inspect.getsource are marked
+``introspect``; run ``pytest -m "not introspect"`` for a quicker pass
+that skips them. With ``--reuse-introspect`` they are skipped only while
+the installed entity-core version and the package and test sources hash the
+same as on the runs where they passed.
+
+The tests share no mutable state across files, so they can be spread over
+cores with pytest-xdist: ``pytest -n auto --dist loadfile``.
+"""
+
+import hashlib
+from importlib import metadata
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+import entity_plugin_examples
+
+_INTROSPECT_CACHE_KEY = "entity_plugin_examples/introspect"
+_introspect_digest_key = pytest.StashKey[str]()
+_introspect_passes_key = pytest.StashKey["_IntrospectPasses"]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--reuse-introspect",
+        action="store_true",
+        help=(
+            "skip introspect tests that passed on identical sources "
+            "(uses the pytest cache)"
+        ),
+    )
+
+
+def _entity_version():
+    """Installed entity-core version, since the introspect tests check its API."""
+    try:
+        return metadata.version("entity-core")
+    except metadata.PackageNotFoundError:
+        import entity
+
+        return getattr(entity, "__version__", "unknown")
+
+
+def _sources_digest():
+    """Hash of the entity-core version and every package and test source file."""
+    digest = hashlib.sha256(_entity_version().encode())
+    for root in (Path(entity_plugin_examples.__file__).parent, Path(__file__).parent):
+        for path in sorted(root.rglob("*.py")):
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _reuse_digest(config):
+    """Digest for --reuse-introspect, computed once per process (None when off)."""
+    if getattr(config, "cache", None) is None:
+        return None
+    if not config.getoption("--reuse-introspect"):
+        return None
+    if _introspect_digest_key not in config.stash:
+        config.stash[_introspect_digest_key] = _sources_digest()
+    return config.stash[_introspect_digest_key]
+
+
+def pytest_collection_modifyitems(config, items):
+    digest = _reuse_digest(config)
+    if digest is None:
+        return
+
+    verdict = config.cache.get(_INTROSPECT_CACHE_KEY, {})
+    if verdict.get("digest") != digest:
+        return
+
+    passed = set(verdict.get("passed", ()))
+    skip = pytest.mark.skip(reason="passed on identical sources (--reuse-introspect)")
+    for item in items:
+        if item.nodeid in passed:
+            item.add_marker(skip)
+
+
+class _IntrospectPasses:
+    """Collects the introspect tests whose body ran and passed."""
+
+    def __init__(self):
+        self.nodeids = set()
+
+    def pytest_runtest_logreport(self, report):
+        # Skips, xfails and xpasses don't count as passing
+        if report.when != "call" or not report.passed or hasattr(report, "wasxfail"):
+            return
+        if "introspect" in report.keywords:
+            self.nodeids.add(report.nodeid)
+
+
+def pytest_configure(config):
+    passes = _IntrospectPasses()
+    config.stash[_introspect_passes_key] = passes
+    config.pluginmanager.register(passes, "introspect-passes")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        # xdist workers report to the controller, which records the verdict
+        return
+    digest = _reuse_digest(config)
+    new_passes = config.stash[_introspect_passes_key].nodeids
+    if digest is None or not new_passes:
+        return
+
+    # Remember this run's passes alongside earlier ones on the same sources
+    verdict = config.cache.get(_INTROSPECT_CACHE_KEY, {})
+    passed = set(new_passes)
+    if verdict.get("digest") == digest:
+        passed.update(verdict.get("passed", ()))
+    config.cache.set(
+        _INTROSPECT_CACHE_KEY, {"digest": digest, "passed": sorted(passed)}
+    )
+
+
+@pytest.fixture
+def llm_mock():
+    """Mock LLM, fresh for each test."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def resources_with_llm(llm_mock):
+    """Resources for plugins that need an LLM."""
+    return {"llm": llm_mock}
+
+
+@pytest.fixture
+def mock_context():
+    """Plugin context stub, fresh for each test.
+
+    Only the memory methods are mocks, since tests assert on their calls;
+    everything else is a plain attribute.
+    """
+    return SimpleNamespace(
+        message=None,
+        get_resource=lambda name: None,
+        recall=AsyncMock(return_value=0),
+        remember=AsyncMock(),
+    )
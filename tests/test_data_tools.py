@@ -0,0 +1,77 @@
+"""Test the parsed_payload path of the data tool plugins."""
+
+import pytest
+
+from entity_plugin_examples.tools.data_analysis import ChartGeneratorPlugin
+from entity_plugin_examples.tools.file_ops import FileConverterPlugin
+
+
+@pytest.mark.asyncio
+async def test_chart_payload_matches_message(mock_context):
+    """Test that a data+labels payload charts the same as the JSON message."""
+    plugin = ChartGeneratorPlugin({})
+    mock_context.message = 'bar:["a", "b"]:[1, 2]'
+    expected = await plugin._execute_impl(mock_context)
+
+    mock_context.message = "bar"
+    mock_context.parsed_payload = {"data": [1, 2], "labels": ["a", "b"]}
+    result = await plugin._execute_impl(mock_context)
+
+    assert result == expected
+    assert "a" in result and "b" in result
+
+
+@pytest.mark.asyncio
+async def test_chart_payload_default_labels(mock_context):
+    """Test that a payload without labels gets index labels."""
+    plugin = ChartGeneratorPlugin({})
+    mock_context.message = "line:[3, 4]"
+    expected = await plugin._execute_impl(mock_context)
+
+    mock_context.message = "line"
+    mock_context.parsed_payload = {"data": [3, 4]}
+
+    assert await plugin._execute_impl(mock_context) == expected
+
+
+@pytest.mark.asyncio
+async def test_chart_payload_rejects_message_data(mock_context):
+    """Test that data in both the message and the payload is an error."""
+    plugin = ChartGeneratorPlugin({})
+    mock_context.message = 'bar:["a", "b"]'
+    mock_context.parsed_payload = {"data": [1, 2]}
+
+    result = await plugin._execute_impl(mock_context)
+
+    assert result.startswith("Error:")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("payload", [
+    [{"name": "John", "age": 30}],
+    {"name": "John", "age": 30},
+], ids=["records", "single_record"])
+async def test_converter_payload_matches_message(mock_context, payload):
+    """Test that a records payload converts the same as the JSON message."""
+    plugin = FileConverterPlugin({})
+    mock_context.message = 'json:csv:[{"name": "John", "age": 30}]'
+    expected = await plugin._execute_impl(mock_context)
+
+    mock_context.message = "json:csv"
+    mock_context.parsed_payload = payload
+    result = await plugin._execute_impl(mock_context)
+
+    assert result == expected
+    assert "name,age" in result
+
+
+@pytest.mark.asyncio
+async def test_converter_payload_requires_json_csv(mock_context):
+    """Test that a payload is only accepted with the bare json:csv message."""
+    plugin = FileConverterPlugin({})
+    mock_context.message = 'json:csv:[{"name": "Jane"}]'
+    mock_context.parsed_payload = [{"name": "John"}]
+
+    result = await plugin._execute_impl(mock_context)
+
+    assert result.startswith("Error:")
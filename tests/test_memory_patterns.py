@@ -1,195 +1,89 @@
 """Basic tests for memory pattern library plugins."""
 
+import importlib
+
 import pytest
 
+from entity.workflow.stages import INPUT, PARSE, THINK, DO, REVIEW, OUTPUT
+from entity_plugin_examples.memory import (
+    ConversationTrackerPlugin,
+    ContextSummarizerPlugin,
+    TurnCounterPlugin,
+    PreferenceLearnerPlugin,
+    StyleAdapterPlugin,
+    TopicTrackerPlugin,
+    SkillAssessorPlugin,
+    ProgressTrackerPlugin,
+    CompetencyMapperPlugin,
+    RapportBuilderPlugin,
+    PersonalityAdapterPlugin,
+    RelationshipTrackerPlugin,
+)
+
+EXPECTED_MEMORY_PLUGINS = (
+    "ConversationTrackerPlugin",
+    "ContextSummarizerPlugin",
+    "TurnCounterPlugin",
+    "PreferenceLearnerPlugin",
+    "StyleAdapterPlugin",
+    "TopicTrackerPlugin",
+    "SkillAssessorPlugin",
+    "ProgressTrackerPlugin",
+    "CompetencyMapperPlugin",
+    "RapportBuilderPlugin",
+    "PersonalityAdapterPlugin",
+    "RelationshipTrackerPlugin",
+)
+
 
 def test_memory_patterns_import():
     """Test that all memory pattern plugins can be imported."""
-    from entity_plugin_examples.memory import (
-        ConversationTrackerPlugin,
-        ContextSummarizerPlugin,
-        TurnCounterPlugin,
-        PreferenceLearnerPlugin,
-        StyleAdapterPlugin,
-        TopicTrackerPlugin,
-        SkillAssessorPlugin,
-        ProgressTrackerPlugin,
-        CompetencyMapperPlugin,
-        RapportBuilderPlugin,
-        PersonalityAdapterPlugin,
-        RelationshipTrackerPlugin,
-    )
+    module = importlib.import_module("entity_plugin_examples.memory")
     
     # Verify all plugins exist
-    assert ConversationTrackerPlugin is not None
-    assert ContextSummarizerPlugin is not None
-    assert TurnCounterPlugin is not None
-    assert PreferenceLearnerPlugin is not None
-    assert StyleAdapterPlugin is not None
-    assert TopicTrackerPlugin is not None
-    assert SkillAssessorPlugin is not None
-    assert ProgressTrackerPlugin is not None
-    assert CompetencyMapperPlugin is not None
-    assert RapportBuilderPlugin is not None
-    assert PersonalityAdapterPlugin is not None
-    assert RelationshipTrackerPlugin is not None
-
-
-def test_conversation_patterns_structure():
-    """Test conversation history patterns have correct structure."""
-    from unittest.mock import AsyncMock
-    from entity_plugin_examples.memory import (
-        ConversationTrackerPlugin,
-        ContextSummarizerPlugin,
-        TurnCounterPlugin,
-    )
-    
-    # Mock resources for plugins that need them
-    mock_llm = AsyncMock()
-    resources_with_llm = {"llm": mock_llm}
-    
-    # Test ConversationTrackerPlugin
-    plugin = ConversationTrackerPlugin({})
-    assert hasattr(plugin, 'supported_stages')
-    assert hasattr(plugin, '_execute_impl')
-    
-    # Test ContextSummarizerPlugin (needs LLM)
-    plugin = ContextSummarizerPlugin(resources_with_llm)
-    assert hasattr(plugin, 'supported_stages')
-    assert hasattr(plugin, '_execute_impl')
-    
-    # Test TurnCounterPlugin
-    plugin = TurnCounterPlugin({})
-    assert hasattr(plugin, 'supported_stages')
-    assert hasattr(plugin, '_execute_impl')
-
-
-def test_user_preferences_patterns_structure():
-    """Test user preferences patterns have correct structure."""
-    from unittest.mock import AsyncMock
-    from entity_plugin_examples.memory import (
-        PreferenceLearnerPlugin,
-        StyleAdapterPlugin,
-        TopicTrackerPlugin,
-    )
-    
-    # Mock resources for plugins that need them
-    mock_llm = AsyncMock()
-    resources_with_llm = {"llm": mock_llm}
-    
-    # Test PreferenceLearnerPlugin
-    plugin = PreferenceLearnerPlugin({})
-    assert hasattr(plugin, 'supported_stages')
-    assert hasattr(plugin, '_execute_impl')
-    
-    # Test StyleAdapterPlugin (needs LLM)
-    plugin = StyleAdapterPlugin(resources_with_llm)
-    assert hasattr(plugin, 'supported_stages') 
-    assert hasattr(plugin, '_execute_impl')
-    
-    # Test TopicTrackerPlugin
-    plugin = TopicTrackerPlugin({})
-    assert hasattr(plugin, 'supported_stages')
-    assert hasattr(plugin, '_execute_impl')
-
-
-def test_skill_tracking_patterns_structure():
-    """Test skill tracking patterns have correct structure."""
-    from entity_plugin_examples.memory import (
-        SkillAssessorPlugin,
-        ProgressTrackerPlugin,
-        CompetencyMapperPlugin,
-    )
-    
-    # Test SkillAssessorPlugin
-    plugin = SkillAssessorPlugin({})
-    assert hasattr(plugin, 'supported_stages')
-    assert hasattr(plugin, '_execute_impl')
-    
-    # Test ProgressTrackerPlugin
-    plugin = ProgressTrackerPlugin({})
-    assert hasattr(plugin, 'supported_stages')
-    assert hasattr(plugin, '_execute_impl')
-    
-    # Test CompetencyMapperPlugin
-    plugin = CompetencyMapperPlugin({})
-    assert hasattr(plugin, 'supported_stages')
-    assert hasattr(plugin, '_execute_impl')
-
-
-def test_relationship_building_patterns_structure():
-    """Test relationship building patterns have correct structure."""
-    from entity_plugin_examples.memory import (
-        RapportBuilderPlugin,
-        PersonalityAdapterPlugin,
-        RelationshipTrackerPlugin,
-    )
-    
-    # Test RapportBuilderPlugin
-    plugin = RapportBuilderPlugin({})
-    assert hasattr(plugin, 'supported_stages')
-    assert hasattr(plugin, '_execute_impl')
-    
-    # Test PersonalityAdapterPlugin
-    plugin = PersonalityAdapterPlugin({})
-    assert hasattr(plugin, 'supported_stages')
-    assert hasattr(plugin, '_execute_impl')
-    
-    # Test RelationshipTrackerPlugin
-    plugin = RelationshipTrackerPlugin({})
-    assert hasattr(plugin, 'supported_stages')
-    assert hasattr(plugin, '_execute_impl')
-
-
-def test_plugin_stage_assignments():
-    """Test that plugins are assigned to appropriate workflow stages."""
-    from unittest.mock import AsyncMock
-    from entity_plugin_examples.memory import (
-        ConversationTrackerPlugin,
-        ContextSummarizerPlugin,
-        TurnCounterPlugin,
-        PreferenceLearnerPlugin,
-        StyleAdapterPlugin,
-        TopicTrackerPlugin,
-        SkillAssessorPlugin,
-        ProgressTrackerPlugin,
-        CompetencyMapperPlugin,
-        RapportBuilderPlugin,
-        PersonalityAdapterPlugin,
-        RelationshipTrackerPlugin,
-    )
-    from entity.workflow.stages import INPUT, PARSE, THINK, DO, REVIEW, OUTPUT
-    
-    # Test stage assignments are valid
-    all_stages = [INPUT, PARSE, THINK, DO, REVIEW, OUTPUT]
-    
-    # Mock resources for plugins that need them
-    mock_llm = AsyncMock()
-    resources_with_llm = {"llm": mock_llm}
+    missing = [name for name in EXPECTED_MEMORY_PLUGINS if not hasattr(module, name)]
+    assert not missing, missing
+
+
+# (plugin class, needs an LLM resource)
+PLUGINS = [
+    (ConversationTrackerPlugin, False),
+    (ContextSummarizerPlugin, True),
+    (TurnCounterPlugin, False),
+    (PreferenceLearnerPlugin, False),
+    (StyleAdapterPlugin, True),
+    (TopicTrackerPlugin, False),
+    (SkillAssessorPlugin, False),
+    (ProgressTrackerPlugin, False),
+    (CompetencyMapperPlugin, False),
+    (RapportBuilderPlugin, False),
+    (PersonalityAdapterPlugin, False),
+    (RelationshipTrackerPlugin, False),
+]
+PLUGIN_IDS = [plugin_cls.__name__ for plugin_cls, _ in PLUGINS]
+
+VALID_STAGES = frozenset({INPUT, PARSE, THINK, DO, REVIEW, OUTPUT})
+
+_REQUIRED_ATTRS = ("supported_stages", "_execute_impl")
+
+
+def _assert_plugin_shape(plugin):
+    """Assert plugin has every attribute a pipeline plugin needs."""
+    missing = [attr for attr in _REQUIRED_ATTRS if not hasattr(plugin, attr)]
+    assert not missing, f"{type(plugin).__name__} missing {missing}"
+
+
+@pytest.mark.parametrize("plugin_cls,needs_llm", PLUGINS, ids=PLUGIN_IDS)
+def test_plugin_stage_assignment(plugin_cls, needs_llm, resources_with_llm):
+    """Test plugin structure and that plugins use valid workflow stages."""
+    plugin = plugin_cls(resources_with_llm if needs_llm else {})
     
-    plugins = [
-        ConversationTrackerPlugin({}),
-        ContextSummarizerPlugin(resources_with_llm),  # needs LLM
-        TurnCounterPlugin({}),
-        PreferenceLearnerPlugin({}),
-        StyleAdapterPlugin(resources_with_llm),  # needs LLM
-        TopicTrackerPlugin({}),
-        SkillAssessorPlugin({}),
-        ProgressTrackerPlugin({}),
-        CompetencyMapperPlugin({}),
-        RapportBuilderPlugin({}),
-        PersonalityAdapterPlugin({}),
-        RelationshipTrackerPlugin({}),
-    ]
+    _assert_plugin_shape(plugin)
+    assert isinstance(plugin.supported_stages, list)
+    assert len(plugin.supported_stages) > 0
     
-    for plugin in plugins:
-        assert hasattr(plugin, 'supported_stages')
-        assert isinstance(plugin.supported_stages, list)
-        assert len(plugin.supported_stages) > 0
-        
-        # Each supported stage should be a valid stage
-        for stage in plugin.supported_stages:
-            assert stage in all_stages
+    # Each supported stage should be a valid stage
+    assert set(plugin.supported_stages).issubset(VALID_STAGES)
 
 
 if __name__ == "__main__":
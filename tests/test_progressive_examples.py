@@ -1,20 +1,85 @@
 """Test the progressive core examples."""
 
+import functools
+import importlib
+import inspect
+import re
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, AsyncMock, MagicMock
+
+from entity.workflow.stages import INPUT, PARSE, THINK, DO, REVIEW, OUTPUT
+from entity_plugin_examples.core import (
+    InstantAgentExample,
+    PipelineVisualizerExample,
+    LayerExplorerExample,
+    WorkflowTemplatesExample,
+    FirstPluginExample,
+    MyFirstPlugin,
+    VisibilityPlugin,
+)
+from entity_plugin_examples.core.first_plugin import PLUGIN_TEMPLATE, first_plugin
+from entity_plugin_examples.core.instant_agent import instant_agent
+from entity_plugin_examples.core.see_the_layers import ResourceExplorerPlugin
+from entity_plugin_examples.core.workflow_templates import (
+    ChatPlugin,
+    ToolPlugin,
+    AnalysisPlugin,
+    create_chat_workflow,
+    create_tool_workflow,
+    create_analysis_workflow,
+)
+
+
+# Several tests inspect the same example source; read it once
+_get_source = functools.lru_cache(maxsize=32)(inspect.getsource)
+
+
+def _assert_has_callable(obj, name):
+    """Assert obj has a callable attribute called name and return it."""
+    attr = getattr(obj, name, None)
+    assert callable(attr), f"{obj!r} missing callable {name}"
+    return attr
+
+
+# Zero-configuration examples must not mention any of these
+_FORBIDDEN_CONFIG_RE = re.compile(r"config|settings|yaml|json|toml|\.env", re.IGNORECASE)
+
+# Pointers from the instant agent example on to the next one
+_NEXT_STEP_RE = re.compile(r"next|see_the_pipeline|pipeline|step", re.IGNORECASE)
+
+# Docstring words that mark the instant agent's extended demo
+_WORD_RE = re.compile(r"\w+")
+_DEMO_INDICATORS = frozenset({"demo", "extended"})
+
+# Story 8's exact format examples
+_STORY_8_PATTERNS = (
+    "[INPUT] Receiving:",
+    "[PARSE] Extracting: math expression",
+    "[THINK] Planning: calculation needed",
+    "[DO] Executing: Calculator plugin",
+    "[REVIEW] Validating: result = 4",
+    "[OUTPUT] Formatting:",
+)
+
+# Lower-case phrases the Story 8 run docstring is checked for
+_STORY_8_INDICATORS = frozenset({"story 8", "6-stage", "pipeline", "visual"})
+_VISIBILITY_TERMS = frozenset({"minimal code", "maximum visibility", "visual"})
+_MATH_INDICATORS = frozenset({"2+2", "calculate", "math"})
+
+
+@pytest.fixture(scope="session")
+def instant_agent_sources():
+    """Sources and class docstring of InstantAgentExample for the Story 7 checks."""
+    return SimpleNamespace(
+        run_src=_get_source(InstantAgentExample.run),
+        cls_src=_get_source(InstantAgentExample),
+        cls_doc=InstantAgentExample.__doc__ or "",
+    )
 
 
 def test_progressive_examples_imports():
     """Test that all progressive examples can be imported."""
-    from entity_plugin_examples.core import (
-        InstantAgentExample,
-        PipelineVisualizerExample,
-        LayerExplorerExample,
-        WorkflowTemplatesExample,
-        FirstPluginExample,
-        MyFirstPlugin,
-    )
-    
     # Verify all example classes exist
     assert InstantAgentExample is not None
     assert PipelineVisualizerExample is not None
@@ -26,119 +91,68 @@ def test_progressive_examples_imports():
 
 def test_instant_agent_structure():
     """Test Layer 0: InstantAgent has correct structure."""
-    from entity_plugin_examples.core.instant_agent import InstantAgentExample
-    
     # Should have a run method
-    assert hasattr(InstantAgentExample, 'run')
-    assert callable(InstantAgentExample.run)
+    _assert_has_callable(InstantAgentExample, "run")
 
 
 def test_story_7_requirements():
     """Test Story 7: Simplify Getting Started Experience requirements."""
-    import inspect
-    from entity_plugin_examples.core.instant_agent import InstantAgentExample
-    
     # Check that run method exists (3-line example)
-    assert hasattr(InstantAgentExample, 'run')
-    assert callable(InstantAgentExample.run)
+    run_method = _assert_has_callable(InstantAgentExample, "run")
     
     # Check method signature for async
-    run_method = getattr(InstantAgentExample, 'run')
     assert inspect.iscoroutinefunction(run_method)
     
     # Check docstring mentions Story 7 requirements
-    docstring = InstantAgentExample.run.__doc__ or ""
-    assert "3-line" in docstring.lower() or "3 lines" in docstring.lower()
+    docstring = (run_method.__doc__ or "").lower()
+    assert "3-line" in docstring or "3 lines" in docstring
     
     # Check that demo method provides next steps
-    assert hasattr(InstantAgentExample, 'demo')
-    demo_docstring = InstantAgentExample.demo.__doc__ or ""
-    assert "demo" in demo_docstring.lower() or "extended" in demo_docstring.lower()
+    demo_method = getattr(InstantAgentExample, 'demo', None)
+    assert demo_method is not None
+    demo_words = set(_WORD_RE.findall((demo_method.__doc__ or "").lower()))
+    assert demo_words & _DEMO_INDICATORS
 
 
-def test_story_7_inline_comments():
-    """Test that Story 7 shows output inline as comments."""
-    import inspect
-    from entity_plugin_examples.core.instant_agent import InstantAgentExample
-    
-    # Get source code of the run method
-    source = inspect.getsource(InstantAgentExample.run)
-    
+# Story 7 source checks, each run as its own case against instant_agent_sources
+_STORY_7_CHECKS = {
     # Should contain inline comments showing expected output
-    assert "# \"Hi! How can I help?\"" in source or "# This appears immediately" in source
-    
+    "inline_comments": lambda src: (
+        "# \"Hi! How can I help?\"" in src.run_src or "# This appears immediately" in src.run_src
+    ),
     # Should show the 3-line pattern clearly
-    assert "agent = Agent()" in source
-    assert "await agent.chat(" in source
+    "agent_constructor": lambda src: "agent = Agent()" in src.run_src,
+    "chat_call": lambda src: "await agent.chat(" in src.run_src,
+    # Should use Agent() without parameters and not reference config files, settings, etc.
+    "zero_configuration": lambda src: (
+        "Agent()" in src.run_src and _FORBIDDEN_CONFIG_RE.search(src.run_src) is None
+    ),
+    # Should mention next steps or reference see_the_pipeline
+    "next_steps": lambda src: _NEXT_STEP_RE.search(f"{src.cls_src}\n{src.cls_doc}") is not None,
+}
 
 
-def test_story_7_zero_configuration():
-    """Test that Story 7 requires no configuration files."""
-    import inspect
-    from entity_plugin_examples.core.instant_agent import InstantAgentExample
-    
-    # Get source code
-    source = inspect.getsource(InstantAgentExample.run)
-    
-    # Should use Agent() without parameters (zero configuration)
-    assert "Agent()" in source
-    
-    # Should not reference config files, settings, etc.
-    forbidden_terms = ["config", "settings", "yaml", "json", "toml", ".env"]
-    for term in forbidden_terms:
-        assert term not in source.lower()
-
-
-def test_story_7_next_steps_guidance():
-    """Test that Story 7 provides clear next steps."""
-    from entity_plugin_examples.core.instant_agent import InstantAgentExample
-    import inspect
-    
-    # Check if there's guidance to next example
-    source = inspect.getsource(InstantAgentExample)
-    docstring = InstantAgentExample.__doc__ or ""
-    
-    # Should mention next steps or reference see_the_pipeline
-    next_step_indicators = ["next", "see_the_pipeline", "pipeline", "step"]
-    has_next_steps = any(indicator in source.lower() or indicator in docstring.lower() 
-                        for indicator in next_step_indicators)
-    
-    assert has_next_steps, "Story 7 should provide clear next steps to second example"
+@pytest.mark.introspect
+@pytest.mark.parametrize("check", _STORY_7_CHECKS)
+def test_story_7_source(check, instant_agent_sources):
+    """Test Story 7's inline output, zero configuration and next steps."""
+    assert _STORY_7_CHECKS[check](instant_agent_sources), f"Story 7 check failed: {check}"
 
 
 def test_pipeline_visualizer_structure():
     """Test Layer 1: PipelineVisualizer has correct structure."""
-    from entity_plugin_examples.core.see_the_pipeline import (
-        PipelineVisualizerExample,
-        VisibilityPlugin
-    )
-    
     # Should have example and plugin
-    assert hasattr(PipelineVisualizerExample, 'run')
+    _assert_has_callable(PipelineVisualizerExample, "run")
     assert hasattr(VisibilityPlugin, 'supported_stages')
     assert hasattr(VisibilityPlugin, '_execute_impl')
 
 
 def test_story_8_requirements():
     """Test Story 8: Create Visual Pipeline Demo requirements."""
-    import inspect
-    from entity_plugin_examples.core.see_the_pipeline import (
-        PipelineVisualizerExample,
-        VisibilityPlugin
-    )
-    
     # Check that run method exists and is async
-    assert hasattr(PipelineVisualizerExample, 'run')
-    assert callable(PipelineVisualizerExample.run)
-    run_method = getattr(PipelineVisualizerExample, 'run')
+    run_method = _assert_has_callable(PipelineVisualizerExample, "run")
     assert inspect.iscoroutinefunction(run_method)
     
-    # Check docstring mentions Story 8 requirements
-    docstring = PipelineVisualizerExample.run.__doc__ or ""
-    story_indicators = ["story 8", "6-stage", "pipeline", "visual"]
-    has_story_context = any(indicator in docstring.lower() for indicator in story_indicators)
-    assert has_story_context, "Should reference Story 8 or pipeline visualization"
-    
     # Check VisibilityPlugin can be instantiated
     resources = {}
     config = {"stage": "INPUT"}
@@ -147,105 +161,74 @@ def test_story_8_requirements():
     assert plugin.supported_stages == ["INPUT"]
 
 
-def test_story_8_visual_format():
-    """Test that Story 8 produces exact visual format specified."""
-    import inspect
-    from entity_plugin_examples.core.see_the_pipeline import VisibilityPlugin
-    
-    # Get source code of the _execute_impl method
-    source = inspect.getsource(VisibilityPlugin._execute_impl)
-    
-    # Should contain Story 8's exact format examples
-    story_8_patterns = [
-        "[INPUT] Receiving:",
-        "[PARSE] Extracting: math expression", 
-        "[THINK] Planning: calculation needed",
-        "[DO] Executing: Calculator plugin",
-        "[REVIEW] Validating: result = 4",
-        "[OUTPUT] Formatting:"
-    ]
-    
-    for pattern in story_8_patterns:
-        assert pattern in source, f"Missing Story 8 format pattern: {pattern}"
+@pytest.fixture(scope="module")
+def visibility_source():
+    """Source of VisibilityPlugin._execute_impl."""
+    return _get_source(VisibilityPlugin._execute_impl)
 
 
-def test_story_8_minimal_code_maximum_visibility():
-    """Test Story 8's minimal code, maximum visibility principle."""
-    import inspect
-    from entity_plugin_examples.core.see_the_pipeline import PipelineVisualizerExample
-    
-    # Get source code
-    source = inspect.getsource(PipelineVisualizerExample.run)
-    docstring = PipelineVisualizerExample.run.__doc__ or ""
-    
-    # Should mention the 80% Code, 20% Explanation principle
-    assert "80%" in docstring and "20%" in docstring
-    
-    # Should mention minimal code, maximum visibility
-    visibility_terms = ["minimal code", "maximum visibility", "visual"]
-    has_visibility_focus = any(term in docstring.lower() for term in visibility_terms)
-    assert has_visibility_focus, "Should emphasize visual demonstration"
+@pytest.mark.introspect
+@pytest.mark.parametrize("pattern", _STORY_8_PATTERNS)
+def test_story_8_visual_format(pattern, visibility_source):
+    """Test that Story 8 produces exact visual format specified."""
+    assert pattern in visibility_source, f"Missing Story 8 format pattern: {pattern}"
 
 
-def test_story_8_calculate_example():
-    """Test that Story 8 uses the Calculate 2+2 example."""
-    import inspect
-    from entity_plugin_examples.core.see_the_pipeline import PipelineVisualizerExample
-    
-    # Get source code
-    source = inspect.getsource(PipelineVisualizerExample.run)
-    
-    # Should use Story 8's specified example
-    assert "Calculate 2+2" in source or "2+2" in source
-    
-    # Should reference the example in docstring
-    docstring = PipelineVisualizerExample.run.__doc__ or ""
-    math_indicators = ["2+2", "calculate", "math"]
-    has_math_example = any(indicator in docstring.lower() for indicator in math_indicators)
-    assert has_math_example, "Should reference the math calculation example"
+@pytest.fixture(scope="module")
+def pipeline_visualizer_sources():
+    """Source and docstring of PipelineVisualizerExample.run."""
+    run_doc = PipelineVisualizerExample.run.__doc__ or ""
+    return SimpleNamespace(
+        run_src=_get_source(PipelineVisualizerExample.run),
+        run_doc=run_doc,
+        run_doc_lower=run_doc.lower(),
+    )
 
 
-def test_story_8_stage_coverage():
+# Story 8 source and docstring checks, run against pipeline_visualizer_sources
+_STORY_8_CHECKS = {
+    # Docstring should reference Story 8 or pipeline visualization
+    "story_context": lambda src: any(indicator in src.run_doc_lower for indicator in _STORY_8_INDICATORS),
+    # Should mention the 80% Code, 20% Explanation principle
+    "code_first": lambda src: "80%" in src.run_doc and "20%" in src.run_doc,
+    # Should emphasize minimal code, maximum visibility
+    "visibility_focus": lambda src: any(term in src.run_doc_lower for term in _VISIBILITY_TERMS),
+    # Should use Story 8's specified Calculate 2+2 example
+    "calculate_example": lambda src: "Calculate 2+2" in src.run_src or "2+2" in src.run_src,
+    # Should reference the math calculation example in the docstring
+    "math_in_docstring": lambda src: any(indicator in src.run_doc_lower for indicator in _MATH_INDICATORS),
+}
+
+
+@pytest.mark.introspect
+@pytest.mark.parametrize("check", _STORY_8_CHECKS)
+def test_story_8_source(check, pipeline_visualizer_sources):
+    """Test Story 8's docstring context, visibility focus and calculate example."""
+    assert _STORY_8_CHECKS[check](pipeline_visualizer_sources), f"Story 8 check failed: {check}"
+
+
+# All 6 stages should be supported
+@pytest.mark.parametrize("stage", [INPUT, PARSE, THINK, DO, REVIEW, OUTPUT])
+def test_story_8_stage_coverage(stage):
     """Test that Story 8 covers all 6 pipeline stages."""
-    from entity_plugin_examples.core.see_the_pipeline import VisibilityPlugin
-    from entity.workflow.stages import INPUT, PARSE, THINK, DO, REVIEW, OUTPUT
-    
-    # All 6 stages should be supported
-    all_stages = [INPUT, PARSE, THINK, DO, REVIEW, OUTPUT]
-    
-    for stage in all_stages:
-        # Should be able to create plugin for each stage
-        resources = {}
-        config = {"stage": stage}
-        plugin = VisibilityPlugin(resources, config)
-        assert plugin.stage_name == stage
-        assert plugin.supported_stages == [stage]
+    # Should be able to create plugin for each stage
+    plugin = VisibilityPlugin({}, {"stage": stage})
+    assert plugin.stage_name == stage
+    assert plugin.supported_stages == [stage]
 
 
 def test_layer_explorer_structure():
     """Test Layer 2: LayerExplorer has correct structure."""
-    from entity_plugin_examples.core.see_the_layers import (
-        LayerExplorerExample,
-        ResourceExplorerPlugin
-    )
-    
     # Should have example and plugin
-    assert hasattr(LayerExplorerExample, 'run')
+    _assert_has_callable(LayerExplorerExample, "run")
     assert hasattr(ResourceExplorerPlugin, 'supported_stages')
     assert ResourceExplorerPlugin.supported_stages == ['think']
 
 
 def test_workflow_templates_structure():
     """Test WorkflowTemplates has correct structure."""
-    from entity_plugin_examples.core.workflow_templates import (
-        WorkflowTemplatesExample,
-        create_chat_workflow,
-        create_tool_workflow,
-        create_analysis_workflow,
-    )
-    
     # Should have example and workflow creators
-    assert hasattr(WorkflowTemplatesExample, 'run')
+    _assert_has_callable(WorkflowTemplatesExample, "run")
     assert callable(create_chat_workflow)
     assert callable(create_tool_workflow)
     assert callable(create_analysis_workflow)
@@ -253,14 +236,8 @@ def test_workflow_templates_structure():
 
 def test_first_plugin_structure():
     """Test FirstPlugin example has correct structure."""
-    from entity_plugin_examples.core.first_plugin import (
-        FirstPluginExample,
-        MyFirstPlugin,
-        PLUGIN_TEMPLATE
-    )
-    
     # Should have example, plugin, and template
-    assert hasattr(FirstPluginExample, 'run')
+    _assert_has_callable(FirstPluginExample, "run")
     assert hasattr(MyFirstPlugin, 'supported_stages')
     assert MyFirstPlugin.supported_stages == ['think']
     assert hasattr(MyFirstPlugin, '_execute_impl')
@@ -268,33 +245,24 @@ def test_first_plugin_structure():
     assert "Plugin" in PLUGIN_TEMPLATE
 
 
-def test_my_first_plugin_instantiation():
+@pytest.fixture(scope="module")
+def my_first_plugin():
+    """MyFirstPlugin instance for read-only checks (it needs no resources)."""
+    return MyFirstPlugin({})
+
+
+def test_my_first_plugin_instantiation(my_first_plugin):
     """Test that MyFirstPlugin can be instantiated."""
-    from entity_plugin_examples.core.first_plugin import MyFirstPlugin
-    
-    # Create mock resources
-    resources = {
-        "llm": Mock(),
-        "memory": Mock(),
-    }
-    
     # Should instantiate without errors
-    plugin = MyFirstPlugin(resources)
-    assert plugin is not None
-    assert plugin.supported_stages == ['think']
+    assert my_first_plugin is not None
+    assert my_first_plugin.supported_stages == ['think']
 
 
 @pytest.mark.asyncio
-async def test_my_first_plugin_execution():
+async def test_my_first_plugin_execution(mock_context):
     """Test that MyFirstPlugin executes correctly."""
-    from entity_plugin_examples.core.first_plugin import MyFirstPlugin
-    
-    # Create mock context
-    context = Mock()
+    context = mock_context
     context.message = "Test message"
-    context.get_resource = Mock(return_value=None)
-    context.recall = AsyncMock(return_value=0)
-    context.remember = AsyncMock()
     
     # Create and execute plugin
     plugin = MyFirstPlugin({})
@@ -307,21 +275,16 @@ async def test_my_first_plugin_execution():
     context.remember.assert_called_once_with("visit_count", 1)
 
 
-def test_visibility_plugin_stages():
+@pytest.mark.parametrize("stage", ("input", "parse", "think", "do", "review", "output"))
+def test_visibility_plugin_stages(stage):
     """Test VisibilityPlugin supports correct stages."""
-    from entity_plugin_examples.core.see_the_pipeline import VisibilityPlugin
-    
-    # Test with different stage configs
-    for stage in ["input", "parse", "think", "do", "review", "output"]:
-        plugin = VisibilityPlugin({}, {"stage": stage})
-        assert plugin.supported_stages == [stage]
-        assert plugin.stage_name == stage
+    plugin = VisibilityPlugin({}, {"stage": stage})
+    assert plugin.supported_stages == [stage]
+    assert plugin.stage_name == stage
 
 
 def test_resource_explorer_plugin():
     """Test ResourceExplorerPlugin structure."""
-    from entity_plugin_examples.core.see_the_layers import ResourceExplorerPlugin
-    
     plugin = ResourceExplorerPlugin({})
     assert plugin.supported_stages == ['think']
     assert hasattr(plugin, '_execute_impl')
@@ -329,12 +292,6 @@ def test_resource_explorer_plugin():
 
 def test_workflow_plugins():
     """Test workflow template plugins."""
-    from entity_plugin_examples.core.workflow_templates import (
-        ChatPlugin,
-        ToolPlugin,
-        AnalysisPlugin,
-    )
-    
     # Test ChatPlugin
     chat = ChatPlugin({})
     assert chat.supported_stages == ['think']
@@ -349,53 +306,57 @@ def test_workflow_plugins():
     assert 'think' in analysis.supported_stages
 
 
-def test_progressive_example_ordering():
+@pytest.mark.parametrize("spec,needle", [
+    ("entity_plugin_examples.core:InstantAgentExample", "zero configuration"),  # Layer 0: Zero config
+    ("entity_plugin_examples.core:PipelineVisualizerExample", "pipeline"),  # Layer 1: Pipeline visibility
+    ("entity_plugin_examples.core:LayerExplorerExample", "layer"),  # Layer 2: Resource layers
+])
+def test_progressive_example_ordering(spec, needle):
     """Test that examples follow Layer 0 → 1 → 2 progression."""
-    from entity_plugin_examples.core import (
-        InstantAgentExample,  # Layer 0
-        PipelineVisualizerExample,  # Layer 1
-        LayerExplorerExample,  # Layer 2
-    )
+    module_path, name = spec.split(":")
+    example_cls = getattr(importlib.import_module(module_path), name)
     
     # Each should exist and represent increasing complexity
-    # Layer 0: Zero config
-    assert InstantAgentExample.__doc__ and "zero configuration" in InstantAgentExample.__doc__.lower()
-    
-    # Layer 1: Pipeline visibility
-    assert PipelineVisualizerExample.__doc__ and "pipeline" in PipelineVisualizerExample.__doc__.lower()
-    
-    # Layer 2: Resource layers
-    assert LayerExplorerExample.__doc__ and "layer" in LayerExplorerExample.__doc__.lower()
+    docstring = (example_cls.__doc__ or "").lower()
+    assert needle in docstring
+
 
+EXAMPLE_MODULE_PATHS = (
+    "entity_plugin_examples.core.instant_agent.instant_agent",
+    "entity_plugin_examples.core.see_the_pipeline.pipeline_visualizer",
+    "entity_plugin_examples.core.see_the_layers.layer_explorer",
+    "entity_plugin_examples.core.workflow_templates.workflow_templates",
+    "entity_plugin_examples.core.first_plugin.first_plugin",
+)
 
-def test_agent_equation_in_examples():
+
+@pytest.fixture(scope="session")
+def example_modules():
+    """Example modules by dotted path, imported once per session."""
+    return {path: importlib.import_module(path) for path in EXAMPLE_MODULE_PATHS}
+
+
+@pytest.mark.parametrize(
+    "module_path", EXAMPLE_MODULE_PATHS, ids=[path.rpartition(".")[2] for path in EXAMPLE_MODULE_PATHS]
+)
+def test_agent_equation_in_examples(module_path, example_modules):
     """Test that each example shows Agent = Resources + Workflow."""
-    import entity_plugin_examples.core.instant_agent.instant_agent as instant
-    import entity_plugin_examples.core.see_the_pipeline.pipeline_visualizer as pipeline
-    import entity_plugin_examples.core.see_the_layers.layer_explorer as layers
-    import entity_plugin_examples.core.workflow_templates.workflow_templates as templates
-    import entity_plugin_examples.core.first_plugin.first_plugin as first
+    module = example_modules[module_path]
     
     # Each module should document the equation
-    for module in [instant, pipeline, layers, templates, first]:
-        assert module.__doc__ is not None
-        assert "Agent = Resources + Workflow" in module.__doc__
+    assert "Agent = Resources + Workflow" in (module.__doc__ or "")
 
 
 def test_code_first_approach():
     """Test that examples follow 80% code, 20% explanation approach."""
-    from entity_plugin_examples.core.instant_agent import instant_agent
-    from entity_plugin_examples.core.first_plugin import first_plugin
-    
     # Check that code examples have minimal but present documentation
-    for module in [instant_agent, first_plugin]:
+    for module, class_name in ((instant_agent, "InstantAgentExample"), (first_plugin, "FirstPluginExample")):
         # Module should have code
         assert hasattr(module, '__file__')
         
         # Should have the 80/20 mention in docstrings
-        content = module.__doc__ or ""
-        example_class = getattr(module, [c for c in dir(module) if "Example" in c][0])
-        if hasattr(example_class, 'run'):
-            run_doc = example_class.run.__doc__ or ""
+        run_method = getattr(getattr(module, class_name), 'run', None)
+        if run_method is not None:
+            run_doc = run_method.__doc__ or ""
             # Should mention code-first approach
             assert "80%" in run_doc or "Code" in run_doc
\ No newline at end of file
@@ -1,16 +1,69 @@
 """Test the specialized domain-specific plugin showcases."""
 
+import ast
+import inspect
+import re
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, AsyncMock
+
+from entity_plugin_examples.specialized import (
+    CodeReviewerExample, StaticAnalysisPlugin, CodeMetricsPlugin, SecurityScanPlugin,
+    ResearchAssistantExample, SourceGathererPlugin, FactCheckerPlugin, SynthesizerPlugin,
+    CustomerServiceExample, IntentClassifierPlugin, KnowledgeBasePlugin, ResponseGeneratorPlugin
+)
+import entity_plugin_examples.specialized as specialized
+import entity_plugin_examples.specialized.code_reviewer.code_reviewer as code_rev
+import entity_plugin_examples.specialized.research_assistant.research_assistant as research
+import entity_plugin_examples.specialized.customer_service.customer_service as service
+
+SHOWCASES = (CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample)
+
+# Markers of a complete showcase, collected in one pass over the run() source
+_COMPLETENESS_RE = re.compile(r"Workflow\(|steps=|context|recall|print\(")
+
+
+@pytest.fixture(scope="session")
+def showcase_run_sources():
+    """Source of each showcase's run(), read once per session."""
+    return {example: inspect.getsource(example.run) for example in SHOWCASES}
+
+
+@pytest.fixture(scope="session")
+def showcase_lower_sources(showcase_run_sources):
+    """Lower-cased run() and class sources of each showcase, for case-insensitive checks."""
+    return SimpleNamespace(
+        run={example: source.lower() for example, source in showcase_run_sources.items()},
+        cls={example: inspect.getsource(example).lower() for example in SHOWCASES},
+    )
+
+
+def _run_calls(example):
+    """Names called directly in an example's run(), so comments and strings don't count."""
+    # run() embeds unindented sample code, so parse the whole module rather than the method
+    tree = ast.parse(inspect.getsource(sys.modules[example.__module__]))
+    cls = next(node for node in tree.body
+               if isinstance(node, ast.ClassDef) and node.name == example.__name__)
+    run = next(node for node in cls.body
+               if isinstance(node, ast.AsyncFunctionDef) and node.name == "run")
+    return {
+        node.func.id
+        for node in ast.walk(run)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+    }
+
+
+@pytest.fixture(scope="session")
+def showcase_run_calls():
+    """Names called in each showcase's run(), parsed once per session."""
+    return {example: _run_calls(example) for example in SHOWCASES}
 
 
 def test_specialized_imports():
     """Test that all specialized examples can be imported."""
-    from entity_plugin_examples.specialized import (
-        CodeReviewerExample, StaticAnalysisPlugin, CodeMetricsPlugin, SecurityScanPlugin,
-        ResearchAssistantExample, SourceGathererPlugin, FactCheckerPlugin, SynthesizerPlugin,
-        CustomerServiceExample, IntentClassifierPlugin, KnowledgeBasePlugin, ResponseGeneratorPlugin
-    )
+    assert sys.modules["entity_plugin_examples.specialized"] is specialized
     
     # Code Reviewer
     assert CodeReviewerExample is not None
@@ -33,32 +86,24 @@ def test_specialized_imports():
 
 def test_story_9_directory_structure():
     """Test Story 9: Directory structure matches requirements."""
-    import os
+    base = Path(specialized.__file__).parent
     
-    base_path = "/Users/ladvien/entity/plugins/examples/src/entity_plugin_examples/specialized"
+    # Walk the tree once and check membership instead of stat-ing each path
+    present = {p.relative_to(base).as_posix() for p in base.rglob("*")}
     
-    # Check required subdirectories exist
-    assert os.path.exists(os.path.join(base_path, "code_reviewer"))
-    assert os.path.exists(os.path.join(base_path, "research_assistant"))
-    assert os.path.exists(os.path.join(base_path, "customer_service"))
-    
-    # Check each has __init__.py
-    assert os.path.exists(os.path.join(base_path, "code_reviewer", "__init__.py"))
-    assert os.path.exists(os.path.join(base_path, "research_assistant", "__init__.py"))
-    assert os.path.exists(os.path.join(base_path, "customer_service", "__init__.py"))
-    
-    # Check each has main implementation file
-    assert os.path.exists(os.path.join(base_path, "code_reviewer", "code_reviewer.py"))
-    assert os.path.exists(os.path.join(base_path, "research_assistant", "research_assistant.py"))
-    assert os.path.exists(os.path.join(base_path, "customer_service", "customer_service.py"))
+    for showcase in ("code_reviewer", "research_assistant", "customer_service"):
+        # Check required subdirectory exists
+        assert showcase in present
+        
+        # Check it has __init__.py
+        assert f"{showcase}/__init__.py" in present
+        
+        # Check it has main implementation file
+        assert f"{showcase}/{showcase}.py" in present
 
 
 def test_story_9_complete_working_systems():
     """Test Story 9: Each showcase is a complete working system."""
-    from entity_plugin_examples.specialized import (
-        CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample
-    )
-    
     # Each should have async run method
     assert hasattr(CodeReviewerExample, 'run')
     assert callable(CodeReviewerExample.run)
@@ -70,40 +115,29 @@ def test_story_9_complete_working_systems():
     assert callable(CustomerServiceExample.run)
     
     # Check they're coroutine functions (async)
-    import inspect
     assert inspect.iscoroutinefunction(CodeReviewerExample.run)
     assert inspect.iscoroutinefunction(ResearchAssistantExample.run)
     assert inspect.iscoroutinefunction(CustomerServiceExample.run)
 
 
-def test_story_9_plugin_composition_focus():
+@pytest.mark.introspect
+def test_story_9_plugin_composition_focus(showcase_run_calls):
     """Test Story 9: Focus on plugin composition, not individual plugins."""
-    import inspect
-    from entity_plugin_examples.specialized import (
-        CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample
-    )
-    
     # Check docstrings mention plugin composition
-    examples = [CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample]
-    
-    for example in examples:
+    for example in SHOWCASES:
         docstring = example.run.__doc__ or ""
         assert "composition" in docstring.lower() or "plugin" in docstring.lower()
         assert "story 9" in docstring.lower()
         
         # Check for Agent = Resources + Workflow pattern
-        source = inspect.getsource(example.run)
-        assert "Agent(" in source
-        assert "workflow" in source.lower()
+        calls = showcase_run_calls[example]
+        assert "Agent" in calls
+        assert "Workflow" in calls
 
 
-def test_story_9_domain_specific_test_data():
+@pytest.mark.introspect
+def test_story_9_domain_specific_test_data(showcase_run_sources):
     """Test Story 9: Include domain-specific test data."""
-    import inspect
-    from entity_plugin_examples.specialized import (
-        CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample
-    )
-    
     # Check for domain-specific test data in source code
     examples = {
         CodeReviewerExample: ["test_code", "def ", "password", "admin123"],
@@ -112,135 +146,87 @@ def test_story_9_domain_specific_test_data():
     }
     
     for example, expected_data in examples.items():
-        source = inspect.getsource(example.run)
+        source = showcase_run_sources[example]
         for data_item in expected_data:
             assert data_item in source, f"{example.__name__} missing domain-specific data: {data_item}"
 
 
-def test_code_reviewer_plugins():
-    """Test Code Reviewer plugin composition."""
-    from entity_plugin_examples.specialized.code_reviewer import (
-        StaticAnalysisPlugin, CodeMetricsPlugin, SecurityScanPlugin
+@pytest.fixture(scope="module")
+def showcase_plugins():
+    """One instance of each showcase plugin for read-only checks (they need no resources)."""
+    plugin_classes = (
+        StaticAnalysisPlugin, CodeMetricsPlugin, SecurityScanPlugin,
+        SourceGathererPlugin, FactCheckerPlugin, SynthesizerPlugin,
+        IntentClassifierPlugin, KnowledgeBasePlugin, ResponseGeneratorPlugin,
     )
-    
+    return {plugin_class: plugin_class({}) for plugin_class in plugin_classes}
+
+
+def _stages(plugin):
+    """Lower-cased stage names a plugin supports."""
+    return {stage.lower() for stage in plugin.supported_stages}
+
+
+def test_code_reviewer_plugins(showcase_plugins):
+    """Test Code Reviewer plugin composition."""
     # Test plugin stages
-    static_plugin = StaticAnalysisPlugin({})
-    assert "parse" in [stage.lower() for stage in static_plugin.supported_stages]
-    
-    metrics_plugin = CodeMetricsPlugin({})
-    assert "think" in [stage.lower() for stage in metrics_plugin.supported_stages]
-    
-    security_plugin = SecurityScanPlugin({})
-    assert "review" in [stage.lower() for stage in security_plugin.supported_stages]
+    assert "parse" in _stages(showcase_plugins[StaticAnalysisPlugin])
+    assert "think" in _stages(showcase_plugins[CodeMetricsPlugin])
+    assert "review" in _stages(showcase_plugins[SecurityScanPlugin])
 
 
-def test_research_assistant_plugins():
+def test_research_assistant_plugins(showcase_plugins):
     """Test Research Assistant plugin composition."""
-    from entity_plugin_examples.specialized.research_assistant import (
-        SourceGathererPlugin, FactCheckerPlugin, SynthesizerPlugin
-    )
-    
     # Test plugin stages
-    sources_plugin = SourceGathererPlugin({})
-    assert "parse" in [stage.lower() for stage in sources_plugin.supported_stages]
-    
-    fact_plugin = FactCheckerPlugin({})
-    assert "think" in [stage.lower() for stage in fact_plugin.supported_stages]
-    
-    synthesis_plugin = SynthesizerPlugin({})
-    assert "do" in [stage.lower() for stage in synthesis_plugin.supported_stages]
+    assert "parse" in _stages(showcase_plugins[SourceGathererPlugin])
+    assert "think" in _stages(showcase_plugins[FactCheckerPlugin])
+    assert "do" in _stages(showcase_plugins[SynthesizerPlugin])
 
 
-def test_customer_service_plugins():
+def test_customer_service_plugins(showcase_plugins):
     """Test Customer Service plugin composition."""
-    from entity_plugin_examples.specialized.customer_service import (
-        IntentClassifierPlugin, KnowledgeBasePlugin, ResponseGeneratorPlugin
-    )
-    
     # Test plugin stages
-    intent_plugin = IntentClassifierPlugin({})
-    assert "parse" in [stage.lower() for stage in intent_plugin.supported_stages]
-    
-    kb_plugin = KnowledgeBasePlugin({})
-    assert "think" in [stage.lower() for stage in kb_plugin.supported_stages]
-    
-    response_plugin = ResponseGeneratorPlugin({})
-    assert "output" in [stage.lower() for stage in response_plugin.supported_stages]
+    assert "parse" in _stages(showcase_plugins[IntentClassifierPlugin])
+    assert "think" in _stages(showcase_plugins[KnowledgeBasePlugin])
+    assert "output" in _stages(showcase_plugins[ResponseGeneratorPlugin])
 
 
-@pytest.mark.asyncio
-async def test_code_reviewer_execution():
-    """Test Code Reviewer plugin execution."""
-    from entity_plugin_examples.specialized.code_reviewer import StaticAnalysisPlugin
-    
-    # Create mock context
-    context = Mock()
-    context.message = '''
+_SAMPLE_CODE = '''
 def authenticate_user(username, password):
     if password == "admin123":
         return True
 '''
-    context.remember = AsyncMock()
-    
-    plugin = StaticAnalysisPlugin({})
-    result = await plugin._execute_impl(context)
-    
-    assert "analysis" in result.lower()
-    context.remember.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_research_assistant_execution():
-    """Test Research Assistant plugin execution."""
-    from entity_plugin_examples.specialized.research_assistant import SourceGathererPlugin
-    
-    # Create mock context
-    context = Mock()
-    context.message = "Latest research on artificial intelligence safety"
-    context.remember = AsyncMock()
-    
-    plugin = SourceGathererPlugin({})
+@pytest.mark.parametrize("plugin_class,message,expected", [
+    (StaticAnalysisPlugin, _SAMPLE_CODE, "analysis"),
+    (SourceGathererPlugin, "Latest research on artificial intelligence safety", "sources"),
+    (IntentClassifierPlugin, "I need a refund for order #12345", "intent"),
+], ids=["code_reviewer", "research_assistant", "customer_service"])
+async def test_showcase_execution(plugin_class, message, expected, mock_context):
+    """Test the first plugin of each showcase executes and stores its result."""
+    context = mock_context
+    context.message = message
+    
+    plugin = plugin_class({})
     result = await plugin._execute_impl(context)
     
-    assert "sources" in result.lower()
-    context.remember.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_customer_service_execution():
-    """Test Customer Service plugin execution."""
-    from entity_plugin_examples.specialized.customer_service import IntentClassifierPlugin
-    
-    # Create mock context
-    context = Mock()
-    context.message = "I need a refund for order #12345"
-    context.remember = AsyncMock()
-    
-    plugin = IntentClassifierPlugin({})
-    result = await plugin._execute_impl(context)
-    
-    assert "intent" in result.lower()
+    assert expected in result.lower()
     context.remember.assert_called_once()
 
 
 def test_agent_equation_in_specialized():
     """Test that specialized examples show Agent = Resources + Workflow."""
-    import entity_plugin_examples.specialized.code_reviewer.code_reviewer as code_rev
-    import entity_plugin_examples.specialized.research_assistant.research_assistant as research
-    import entity_plugin_examples.specialized.customer_service.customer_service as service
-    
     # Each module should document the equation
-    for module in [code_rev, research, service]:
-        assert module.__doc__ is not None
-        assert "Agent = Resources + Workflow" in module.__doc__
+    for module in (code_rev, research, service):
+        doc = module.__doc__
+        assert doc is not None
+        assert "Agent = Resources + Workflow" in doc
 
 
 def test_80_20_principle_in_specialized():
     """Test that specialized examples follow 80% code, 20% explanation."""
-    from entity_plugin_examples.specialized import (
-        CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample
-    )
-    
     examples = [CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample]
     
     for example in examples:
@@ -249,14 +235,9 @@ def test_80_20_principle_in_specialized():
         assert "80%" in docstring and "20%" in docstring
 
 
+@pytest.mark.introspect
 def test_specialized_memory_operations():
     """Test that specialized plugins use memory operations correctly."""
-    from entity_plugin_examples.specialized.code_reviewer import StaticAnalysisPlugin
-    from entity_plugin_examples.specialized.research_assistant import SourceGathererPlugin
-    from entity_plugin_examples.specialized.customer_service import IntentClassifierPlugin
-    
-    import inspect
-    
     plugins = [StaticAnalysisPlugin, SourceGathererPlugin, IntentClassifierPlugin]
     
     for plugin_class in plugins:
@@ -265,54 +246,39 @@ def test_specialized_memory_operations():
         assert "context.remember" in source or "remember(" in source
 
 
-def test_specialized_showcase_completeness():
+@pytest.mark.introspect
+def test_specialized_showcase_completeness(showcase_run_sources):
     """Test that each specialized showcase demonstrates complete workflow."""
-    import inspect
-    from entity_plugin_examples.specialized import (
-        CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample
-    )
-    
-    examples = [CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample]
-    
-    for example in examples:
-        source = inspect.getsource(example.run)
+    for example in SHOWCASES:
+        found = set(_COMPLETENESS_RE.findall(showcase_run_sources[example]))
         
         # Should create workflow with multiple stages
-        assert "Workflow(" in source
-        assert "steps=" in source
+        assert "Workflow(" in found
+        assert "steps=" in found
         
         # Should show results from plugin composition
-        assert "context" in source or "recall" in source
+        assert "context" in found or "recall" in found
         
         # Should have demo output
-        assert "print(" in source
+        assert "print(" in found
 
 
-def test_specialized_examples_next_steps():
+@pytest.mark.introspect
+def test_specialized_examples_next_steps(showcase_lower_sources):
     """Test that specialized examples provide next steps guidance."""
-    import inspect
-    from entity_plugin_examples.specialized import (
-        CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample
-    )
-    
-    examples = [CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample]
-    
-    for example in examples:
-        source = inspect.getsource(example.run)
+    for example in SHOWCASES:
+        source = showcase_lower_sources.run[example]
         
         # Should mention other specialized examples
         next_step_indicators = ["next:", "try", "code_reviewer", "research_assistant", "customer_service"]
-        has_next_steps = any(indicator in source.lower() for indicator in next_step_indicators)
+        has_next_steps = any(indicator in source for indicator in next_step_indicators)
         
         assert has_next_steps, f"{example.__name__} should provide next steps guidance"
 
 
-def test_specialized_domain_focus():
+@pytest.mark.introspect
+def test_specialized_domain_focus(showcase_lower_sources):
     """Test that each specialized example focuses on its domain."""
-    from entity_plugin_examples.specialized import (
-        CodeReviewerExample, ResearchAssistantExample, CustomerServiceExample
-    )
-    
     # Test domain-specific focus in docstrings and source
     domain_tests = [
         (CodeReviewerExample, ["code", "review", "analysis", "security", "static"]),
@@ -320,11 +286,9 @@ def test_specialized_domain_focus():
         (CustomerServiceExample, ["customer", "service", "intent", "knowledge", "support"])
     ]
     
-    import inspect
-    
     for example, expected_terms in domain_tests:
         docstring = (example.__doc__ or "").lower()
-        source = inspect.getsource(example).lower()
+        source = showcase_lower_sources.cls[example]
         
         # Should contain domain-specific terminology
         for term in expected_terms[:2]:  # Check at least 2 terms
@@ -1,93 +1,103 @@
 """Test Story 10: Update Import Paths and Tests."""
 
+import importlib
 import os
+import re
+import sys
+import time
+from pathlib import Path
+
 import pytest
 
+# Repository root, relative to this file so any checkout works
+_CHECKOUT = Path(__file__).resolve().parent.parent
 
-def test_story_10_all_imports_work():
-    """Test that all import statements match new structure."""
-    # Core imports
-    from entity_plugin_examples.core import (
-        InstantAgentExample,
-        PipelineVisualizerExample,
-        LayerExplorerExample,
-        WorkflowTemplatesExample,
-        FirstPluginExample,
-        MyFirstPlugin,
-    )
-    
-    # Additional core imports that were missing
-    from entity_plugin_examples.core.see_the_layers import ResourceExplorerPlugin
-    from entity_plugin_examples.core.workflow_templates import (
-        ChatPlugin,
-        ToolPlugin,
-        AnalysisPlugin,
-        create_chat_workflow,
-        create_tool_workflow,
-        create_analysis_workflow,
-    )
-    from entity_plugin_examples.core.first_plugin import PLUGIN_TEMPLATE
-    
-    # Tools imports
-    from entity_plugin_examples.tools import (
-        CalculatorPlugin,
-        OutputFormatterPlugin,
-    )
-    
-    # Memory imports  
-    from entity_plugin_examples.memory import (
-        KeywordExtractorPlugin,
-        ReasonGeneratorPlugin,
-    )
-    
-    # Patterns imports
-    from entity_plugin_examples.patterns import StaticReviewerPlugin
-    
-    # Specialized imports
-    from entity_plugin_examples.specialized import (
-        CodeReviewerExample,
-        ResearchAssistantExample,
-        CustomerServiceExample,
-    )
-    
-    # All imports should work without errors
-    assert InstantAgentExample is not None
-    assert ResourceExplorerPlugin is not None
-    assert create_chat_workflow is not None
-    assert PLUGIN_TEMPLATE is not None
+_MIGRATION_SECTIONS = (
+    "Import Changes",
+    "Backward Compatibility",
+    "Migration Steps",
+    "New Directory Structure",
+)
+_MIGRATION_SECTIONS_RE = re.compile("|".join(map(re.escape, _MIGRATION_SECTIONS)))
 
 
-def test_story_10_backward_compatibility():
-    """Test that backward compatibility is maintained."""
-    # These old-style imports should still work
-    from entity_plugin_examples import (
-        CalculatorPlugin,
-        KeywordExtractorPlugin,
-        OutputFormatterPlugin,
-        ReasonGeneratorPlugin,
-        StaticReviewerPlugin,
-    )
-    
-    assert CalculatorPlugin is not None
-    assert KeywordExtractorPlugin is not None
-    assert OutputFormatterPlugin is not None
-    assert ReasonGeneratorPlugin is not None
-    assert StaticReviewerPlugin is not None
+IMPORT_CASES = [
+    # New structure
+    ("entity_plugin_examples.core", (
+        "InstantAgentExample",
+        "PipelineVisualizerExample",
+        "LayerExplorerExample",
+        "WorkflowTemplatesExample",
+        "FirstPluginExample",
+        "MyFirstPlugin",
+    )),
+    ("entity_plugin_examples.core.see_the_layers", ("ResourceExplorerPlugin",)),
+    ("entity_plugin_examples.core.workflow_templates", (
+        "ChatPlugin",
+        "ToolPlugin",
+        "AnalysisPlugin",
+        "create_chat_workflow",
+        "create_tool_workflow",
+        "create_analysis_workflow",
+    )),
+    ("entity_plugin_examples.core.first_plugin", ("PLUGIN_TEMPLATE",)),
+    ("entity_plugin_examples.tools", ("CalculatorPlugin", "OutputFormatterPlugin")),
+    ("entity_plugin_examples.memory", ("KeywordExtractorPlugin", "ReasonGeneratorPlugin")),
+    ("entity_plugin_examples.patterns", ("StaticReviewerPlugin",)),
+    ("entity_plugin_examples.specialized", (
+        # Code Reviewer
+        "CodeReviewerExample",
+        "StaticAnalysisPlugin",
+        "CodeMetricsPlugin",
+        "SecurityScanPlugin",
+        # Research Assistant
+        "ResearchAssistantExample",
+        "SourceGathererPlugin",
+        "FactCheckerPlugin",
+        "SynthesizerPlugin",
+        # Customer Service
+        "CustomerServiceExample",
+        "IntentClassifierPlugin",
+        "KnowledgeBasePlugin",
+        "ResponseGeneratorPlugin",
+    )),
+    # Old-style imports kept for backward compatibility
+    ("entity_plugin_examples", (
+        "CalculatorPlugin",
+        "KeywordExtractorPlugin",
+        "OutputFormatterPlugin",
+        "ReasonGeneratorPlugin",
+        "StaticReviewerPlugin",
+    )),
+    # Deep imports, which would surface circular import errors
+    ("entity_plugin_examples.core.instant_agent", ("InstantAgentExample",)),
+    ("entity_plugin_examples.tools.calculator", ("BasicCalculatorPlugin",)),
+    ("entity_plugin_examples.memory.conversation_history", ("ConversationTrackerPlugin",)),
+    ("entity_plugin_examples.patterns.dual_interface", ("DualInterfacePlugin",)),
+    ("entity_plugin_examples.specialized.code_reviewer", ("CodeReviewerExample",)),
+]
+
+
+@pytest.mark.parametrize("module_path,names", IMPORT_CASES, ids=[case[0] for case in IMPORT_CASES])
+def test_story_10_imports(module_path, names):
+    """Test that imports work from the new structure and the old top level."""
+    module = importlib.import_module(module_path)
+    
+    missing = [name for name in names if getattr(module, name, None) is None]
+    assert not missing, missing
 
 
 def test_story_10_migration_guide_exists():
     """Test that migration guide for existing users exists."""
-    migration_guide_path = "/Users/ladvien/entity/plugins/examples/MIGRATION_GUIDE.md"
-    assert os.path.exists(migration_guide_path), "Migration guide should exist"
+    migration_guide_path = _CHECKOUT / "MIGRATION_GUIDE.md"
+    assert migration_guide_path.exists(), "Migration guide should exist"
+    
+    content = migration_guide_path.read_text()
     
-    # Check that migration guide contains key sections
-    with open(migration_guide_path, 'r') as f:
-        content = f.read()
-        
-    assert "Import Changes" in content
-    assert "Backward Compatibility" in content
-    assert "Migration Steps" in content
-    assert "New Directory Structure" in content
+    # Check that migration guide contains key sections, in one pass over the text
+    found = set(_MIGRATION_SECTIONS_RE.findall(content))
+    missing = [section for section in _MIGRATION_SECTIONS if section not in found]
+    assert not missing, missing
 
 
 def test_story_10_core_exports_complete():
@@ -95,39 +105,36 @@ def test_story_10_core_exports_complete():
     import entity_plugin_examples.core
     
     # Check main core exports
-    expected_core_exports = [
+    expected_core_exports = {
         "InstantAgentExample",
-        "PipelineVisualizerExample", 
+        "PipelineVisualizerExample",
         "LayerExplorerExample",
         "WorkflowTemplatesExample",
         "FirstPluginExample",
         "MyFirstPlugin",
         "VisibilityPlugin",
-    ]
+    }
     
-    for export in expected_core_exports:
-        assert export in entity_plugin_examples.core.__all__
+    missing = expected_core_exports.difference(entity_plugin_examples.core.__all__)
+    assert not missing, sorted(missing)
 
 
-def test_story_10_submodule_exports():
+@pytest.mark.parametrize("submodule,expected", [
+    ("see_the_layers", {"LayerExplorerExample", "ResourceExplorerPlugin"}),
+    ("workflow_templates", {
+        "WorkflowTemplatesExample",
+        "create_chat_workflow",
+        "create_tool_workflow",
+        "create_analysis_workflow",
+    }),
+    ("first_plugin", {"FirstPluginExample", "MyFirstPlugin", "PLUGIN_TEMPLATE"}),
+])
+def test_story_10_submodule_exports(submodule, expected):
     """Test that submodule exports are properly updated."""
-    # Test see_the_layers exports
-    from entity_plugin_examples.core import see_the_layers
-    assert "LayerExplorerExample" in see_the_layers.__all__
-    assert "ResourceExplorerPlugin" in see_the_layers.__all__
-    
-    # Test workflow_templates exports
-    from entity_plugin_examples.core import workflow_templates
-    assert "WorkflowTemplatesExample" in workflow_templates.__all__
-    assert "create_chat_workflow" in workflow_templates.__all__
-    assert "create_tool_workflow" in workflow_templates.__all__
-    assert "create_analysis_workflow" in workflow_templates.__all__
+    module = importlib.import_module(f"entity_plugin_examples.core.{submodule}")
     
-    # Test first_plugin exports
-    from entity_plugin_examples.core import first_plugin
-    assert "FirstPluginExample" in first_plugin.__all__
-    assert "MyFirstPlugin" in first_plugin.__all__
-    assert "PLUGIN_TEMPLATE" in first_plugin.__all__
+    missing = expected.difference(module.__all__)
+    assert not missing, sorted(missing)
 
 
 def test_story_10_memory_subcategories():
@@ -196,87 +203,37 @@ def test_story_10_tools_subcategories():
     assert DataValidatorPlugin is not None
 
 
-def test_story_10_specialized_complete():
-    """Test that specialized showcases have all imports."""
-    from entity_plugin_examples.specialized import (
-        # Code Reviewer
-        CodeReviewerExample,
-        StaticAnalysisPlugin,
-        CodeMetricsPlugin,
-        SecurityScanPlugin,
-        # Research Assistant
-        ResearchAssistantExample,
-        SourceGathererPlugin,
-        FactCheckerPlugin,
-        SynthesizerPlugin,
-        # Customer Service
-        CustomerServiceExample,
-        IntentClassifierPlugin,
-        KnowledgeBasePlugin,
-        ResponseGeneratorPlugin,
-    )
-    
-    # All specialized imports should work
-    assert CodeReviewerExample is not None
-    assert StaticAnalysisPlugin is not None
-    assert ResearchAssistantExample is not None
-    assert SourceGathererPlugin is not None
-    assert CustomerServiceExample is not None
-    assert IntentClassifierPlugin is not None
-
-
-def test_story_10_no_circular_imports():
-    """Test that there are no circular import issues."""
-    # Try importing everything at once
-    import entity_plugin_examples
-    import entity_plugin_examples.core
-    import entity_plugin_examples.tools
-    import entity_plugin_examples.memory
-    import entity_plugin_examples.patterns
-    import entity_plugin_examples.specialized
-    
-    # Then try specific deep imports
-    from entity_plugin_examples.core.instant_agent import InstantAgentExample
-    from entity_plugin_examples.tools.calculator import BasicCalculatorPlugin
-    from entity_plugin_examples.memory.conversation_history import ConversationTrackerPlugin
-    from entity_plugin_examples.patterns.dual_interface import DualInterfacePlugin
-    from entity_plugin_examples.specialized.code_reviewer import CodeReviewerExample
-    
-    # All imports should work without circular import errors
-    assert InstantAgentExample is not None
-    assert BasicCalculatorPlugin is not None
-    assert ConversationTrackerPlugin is not None
-    assert DualInterfacePlugin is not None
-    assert CodeReviewerExample is not None
-
-
 def test_story_10_import_performance():
     """Test that reorganized imports don't significantly impact performance."""
-    import time
-    import importlib
-    import sys
+    def package_modules():
+        return [name for name in sys.modules
+                if name == "entity_plugin_examples" or name.startswith("entity_plugin_examples.")]
     
-    # Clear the module from cache if it exists
-    if 'entity_plugin_examples' in sys.modules:
-        del sys.modules['entity_plugin_examples']
+    # Drop the package and all its submodules so the whole tree is re-imported,
+    # then put the originals back for the tests that already hold references
+    cached = {name: sys.modules.pop(name) for name in package_modules()}
     
-    # Measure import time
-    start_time = time.time()
-    import entity_plugin_examples
-    import_time = time.time() - start_time
+    try:
+        # Measure import time
+        start_ns = time.perf_counter_ns()
+        import entity_plugin_examples
+        import_ns = time.perf_counter_ns() - start_ns
+    finally:
+        for name in package_modules():
+            del sys.modules[name]
+        sys.modules.update(cached)
     
-    # Import time should be reasonable (under 1 second)
-    assert import_time < 1.0, f"Import took {import_time:.2f} seconds, which is too slow"
+    # Import time should be reasonable (under half a second)
+    assert import_ns < 500_000_000, f"Import took {import_ns / 1e9:.2f} seconds, which is too slow"
 
 
 def test_story_10_all_tests_updated():
     """Test that all test files are updated to use new imports."""
-    import glob
-    
-    test_files = glob.glob("/Users/ladvien/entity/plugins/examples/tests/*.py")
+    with os.scandir(_CHECKOUT / "tests") as entries:
+        test_file_names = {entry.name for entry in entries if entry.name.endswith(".py")}
     
     # Check that test files exist
-    assert len(test_files) > 0, "No test files found"
+    assert len(test_file_names) > 0, "No test files found"
     
     # Check specific test files that should be updated
     expected_test_files = [
@@ -286,7 +243,5 @@ def test_story_10_all_tests_updated():
         "test_specialized_showcases.py",
     ]
     
-    test_file_names = [os.path.basename(f) for f in test_files]
-    
     for expected_file in expected_test_files:
-        assert expected_file in test_file_names, f"{expected_file} should exist"
\ No newline at end of file
+        assert expected_file in test_file_names, f"{expected_file} should exist"
@@ -0,0 +1,70 @@
+"""Test the retry logic of TypedExamplePlugin."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from entity_plugin_examples.core import TypedExamplePlugin
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def _plugin(*outcomes, healthy=True):
+    """Plugin whose LLM yields ``outcomes`` in turn (exceptions are raised)."""
+    llm = AsyncMock()
+    llm.generate.side_effect = outcomes
+    llm.health_check = Mock(return_value=healthy)
+    return TypedExamplePlugin({}, llm=llm, memory=AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_transient_error_is_retried_with_backoff(sleeps):
+    """Test that transient errors are retried after a health check and backoff."""
+    plugin = _plugin(TimeoutError(), ConnectionError(), "  hello  ")
+
+    assert await plugin._generate_with_retries("hi", max_retries=3) == "hello"
+    assert plugin.llm.health_check.call_count == 2
+    assert sleeps == [0.1, 0.2]
+
+
+@pytest.mark.asyncio
+async def test_transient_error_gives_up_after_max_retries(sleeps):
+    """Test that the last transient failure is raised without a health check."""
+    plugin = _plugin(TimeoutError(), TimeoutError())
+
+    with pytest.raises(RuntimeError, match="after 2 attempts"):
+        await plugin._generate_with_retries("hi", max_retries=2)
+    assert plugin.llm.health_check.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_transient_error_with_failed_health_check(sleeps):
+    """Test that a failing health check stops the retries."""
+    plugin = _plugin(ConnectionError(), "unused", healthy=False)
+
+    with pytest.raises(RuntimeError, match="health check failed"):
+        await plugin._generate_with_retries("hi", max_retries=3)
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_other_errors_fail_fast(sleeps):
+    """Test that non-transient errors are not retried or health-checked."""
+    plugin = _plugin(ValueError("bad prompt"), "unused")
+
+    with pytest.raises(RuntimeError, match="LLM generation failed") as excinfo:
+        await plugin._generate_with_retries("hi", max_retries=3)
+    assert isinstance(excinfo.value.__cause__, ValueError)
+    plugin.llm.health_check.assert_not_called()
+    assert sleeps == []
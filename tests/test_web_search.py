@@ -0,0 +1,106 @@
+"""Test the web search tool plugins."""
+
+import asyncio
+
+import pytest
+
+from entity_plugin_examples.tools.web_search import (
+    SearchEnginePlugin,
+    URLExtractorPlugin,
+    WebScraperPlugin,
+)
+from entity_plugin_examples.tools.web_search.url_extractor import _categorize_domain
+
+
+@pytest.fixture(scope="module")
+def url_extractor():
+    """URLExtractorPlugin with default config, shared by the module's tests."""
+    return URLExtractorPlugin({})
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("see https://x.com/user@y.com", ["https://x.com/user", "mailto:user@y.com"]),
+    ("www.foo@bar.com", ["https://www.foo", "mailto:www.foo@bar.com"]),
+], ids=["email_in_url_path", "email_starting_with_www"])
+def test_url_extractor_keeps_overlapping_emails(url_extractor, text, expected):
+    """Test that an email overlapping a URL is reported alongside it."""
+    urls = [found["url"] for found in url_extractor._extract_urls(text)]
+
+    assert urls == expected
+
+
+def test_url_extractor_dedupes_emails(url_extractor):
+    """Test that a repeated address is reported once."""
+    found = url_extractor._extract_urls("mail a@b.com or a@b.com")
+
+    assert [(e["url"], e["position"]) for e in found] == [("mailto:a@b.com", (5, 12))]
+
+
+@pytest.mark.parametrize("domain", ["apnews.com", "www.apnews.com"])
+def test_categorize_domain_apnews_is_news(domain):
+    """Test that the AP news site stays categorized as news."""
+    assert _categorize_domain(domain) == "news"
+
+
+@pytest.mark.parametrize("query,expected_url", [
+    ("what is python?", "https://www.python.org"),
+    ("python, tutorial", "https://www.python.org"),
+    ("Machine-learning!", "https://scikit-learn.org"),
+], ids=["question_mark", "comma", "hyphen"])
+def test_search_matches_punctuated_query(query, expected_url):
+    """Test that punctuation in the query doesn't defeat the demo index."""
+    results = SearchEnginePlugin({})._perform_search(query)
+
+    assert results[0]["url"] == expected_url
+
+
+@pytest.fixture
+def web_scraper():
+    """A fresh WebScraperPlugin, since tests may patch its methods."""
+    return WebScraperPlugin({})
+
+
+@pytest.mark.asyncio
+async def test_batch_scrape_inside_event_loop(web_scraper):
+    """Test that the synchronous batch_scrape works while an event loop is running."""
+    urls = ["https://www.python.org", "https://github.com/ladvien/entity"]
+
+    results = web_scraper.batch_scrape(urls)
+
+    assert list(results) == urls
+    assert results == await web_scraper.batch_scrape_async(urls)
+
+
+@pytest.mark.asyncio
+async def test_batch_scrape_async_reports_errors(web_scraper, monkeypatch):
+    """Test that per-URL exceptions become error results."""
+    async def failing_scrape(url):
+        raise ValueError(f"bad url: {url}")
+
+    monkeypatch.setattr(web_scraper, "_scrape_url_async", failing_scrape)
+
+    results = await web_scraper.batch_scrape_async(["https://a.test"])
+
+    assert results == {"https://a.test": {"error": "bad url: https://a.test"}}
+
+
+@pytest.mark.asyncio
+async def test_batch_scrape_async_propagates_cancellation(web_scraper, monkeypatch):
+    """Test that cancellation is not swallowed into the results."""
+    async def cancelled_scrape(url):
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(web_scraper, "_scrape_url_async", cancelled_scrape)
+
+    with pytest.raises(asyncio.CancelledError):
+        await web_scraper.batch_scrape_async(["https://a.test"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_batch_scrape_async_rejects_bad_concurrency(web_scraper, concurrency):
+    """Test that a concurrency below 1 fails instead of hanging."""
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        await asyncio.wait_for(
+            web_scraper.batch_scrape_async(["https://a.test"], concurrency), 1
+        )